@@ -11,7 +11,6 @@ Usage:
 
 import os
 import sys
-import asyncio
 import argparse
 import logging
 from pathlib import Path
@@ -25,23 +24,26 @@ if sys.platform == "win32":
     except Exception:
         pass
 
-# Suppress noisy logs
-logging.getLogger("src.websocket_client").setLevel(logging.WARNING)
-logging.getLogger("src.bot").setLevel(logging.WARNING)
-logging.getLogger("websockets").setLevel(logging.WARNING)
-
-from dotenv import load_dotenv
-load_dotenv()
+# Suppress noisy logs (applied in one place before any module creates children)
+LOG_LEVELS = {
+    "src.websocket_client": logging.WARNING,
+    "src.bot": logging.WARNING,
+    "websockets": logging.WARNING,
+}
+for _name, _level in LOG_LEVELS.items():
+    logging.getLogger(_name).setLevel(_level)
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.bot import TradingBot
-from src.config import Config
-from strategies.paper_arena import PaperArena
-from strategies.signals import ALL_SIGNALS
+from lib.runtime import install_fast_loop, load_env_file, run_main
+
+# Auto-load .env (never overrides variables already exported)
+load_env_file()
 
 
 def main():
+    install_fast_loop()
+
     parser = argparse.ArgumentParser(
         description="Paper Arena: 10 strategies, paper trading simultaneously"
     )
@@ -90,6 +92,13 @@ def main():
         print("Error: POLY_PRIVATE_KEY and POLY_SAFE_ADDRESS must be set")
         sys.exit(1)
 
+    # Heavy imports (web3, websockets, strategies) deferred until args and
+    # env are validated so --help and usage errors return immediately.
+    from src.bot import TradingBot
+    from src.config import Config
+    from strategies.paper_arena import PaperArena
+    from strategies.signals import ALL_SIGNALS
+
     # Create bot (needed for future live mode, used for balance checks)
     config = Config.from_env()
     bot = TradingBot(config=config, private_key=private_key)
@@ -125,30 +134,38 @@ def main():
 
     # Print config
     coin_str = "/".join(coins)
-    print()
-    print("=" * 60)
-    print("  PAPER ARENA — Strategy Tournament")
-    print("=" * 60)
-    print()
-    print(f"  Coins:         {coin_str} ({len(coins)} coins)")
-    print(f"  Timeframe:     {args.timeframe}")
-    print(f"  Bankroll:      ${args.bankroll:.2f} per strategy")
-    print(f"  Tokens/trade:  5 (min-size)")
-    print(f"  Mode:          PAPER (observe only)")
-    print()
-    print(f"  Strategies ({len(registered)}):")
+    # Banner is assembled in memory and written once: a single syscall,
+    # and no interleaving when stdout is captured line-by-line.
+    banner = []
+    out = banner.append
+
+    out("")
+    out("=" * 60)
+    out("  PAPER ARENA — Strategy Tournament")
+    out("=" * 60)
+    out("")
+    out(f"  Coins:         {coin_str} ({len(coins)} coins)")
+    out(f"  Timeframe:     {args.timeframe}")
+    out(f"  Bankroll:      ${args.bankroll:.2f} per strategy")
+    out(f"  Tokens/trade:  5 (min-size)")
+    out(f"  Mode:          PAPER (observe only)")
+    out("")
+    out(f"  Strategies ({len(registered)}):")
     for s in registered:
         coin_info = f" [{'/'.join(s.coins)}]" if s.coins != ["BTC", "ETH", "SOL", "XRP"] else ""
-        print(f"    {s.name:<15} {s.description}{coin_info}")
-    print()
-    print(f"  CSV logs:      data/arena_<strategy>.csv")
-    print(f"  Settlement:    Gamma API only (every 30s)")
-    print()
-    print("  Goal: 50 verified trades per strategy → evaluate → winners go live")
-    print()
+        out(f"    {s.name:<15} {s.description}{coin_info}")
+    out("")
+    out(f"  CSV logs:      data/arena_<strategy>.csv")
+    out(f"  Settlement:    Gamma API only (every 30s)")
+    out("")
+    out("  Goal: 50 verified trades per strategy → evaluate → winners go live")
+    out("")
+
+    sys.stdout.write("\n".join(banner) + "\n")
+    sys.stdout.flush()
 
     try:
-        asyncio.run(arena.run())
+        run_main(arena.run())
     except KeyboardInterrupt:
         print("\nArena interrupted by user")
     except Exception as e:
@@ -37,6 +37,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from lib.binance_ws import BinancePriceFeed
 SECONDS_PER_YEAR = 365.25 * 24 * 3600
 from lib.market_manager import MarketManager
+from lib.runtime import install_fast_loop, run_main
 from src.client import ClobClient
 from src.gamma_client import GammaClient
 
@@ -555,9 +556,12 @@ def main():
     parser.add_argument("--output", default="data/collector.csv")
     args = parser.parse_args()
 
+    loop_name = install_fast_loop()
+    log.info("Event loop: %s", loop_name)
+
     collector = SignalCollector(args.coins, args.timeframe, args.output)
     try:
-        asyncio.run(collector.run())
+        run_main(collector.run())
     except KeyboardInterrupt:
         log.info("Stopped.")
 
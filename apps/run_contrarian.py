@@ -21,7 +21,6 @@ Usage:
 
 import os
 import sys
-import asyncio
 import argparse
 import logging
 from pathlib import Path
@@ -35,25 +34,30 @@ if sys.platform == "win32":
     except Exception:
         pass
 
-# Suppress noisy logs
-logging.getLogger("src.websocket_client").setLevel(logging.WARNING)
-logging.getLogger("src.bot").setLevel(logging.WARNING)
-
-# Auto-load .env file
-from dotenv import load_dotenv
-load_dotenv()
+# Suppress noisy logs (applied in one place before any module creates children)
+LOG_LEVELS = {
+    "src.websocket_client": logging.WARNING,
+    "src.bot": logging.WARNING,
+}
+for _name, _level in LOG_LEVELS.items():
+    logging.getLogger(_name).setLevel(_level)
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from lib.runtime import install_fast_loop, load_env_file, run_main
+
+# Auto-load .env (never overrides variables already exported)
+load_env_file()
+
 from lib.console import Colors
-from src.bot import TradingBot
-from src.config import Config
-from strategies.contrarian import ContrarianStrategy, ContrarianConfig
+from lib.sizing import sizing_preview
 
 
 def main():
     """Main entry point."""
+    install_fast_loop()
+
     parser = argparse.ArgumentParser(
         description="Contrarian Cheap-Side Strategy for Polymarket crypto markets"
     )
@@ -142,6 +146,38 @@ def main():
         default="data/trades.csv",
         help="Trade log CSV file path (default: data/trades.csv)"
     )
+    parser.add_argument(
+        "--log-buffer-rows",
+        type=int,
+        default=32,
+        help="Resolved trades buffered before appending to the CSV (default: 32)"
+    )
+    parser.add_argument(
+        "--log-flush-interval",
+        type=float,
+        default=5.0,
+        help="Max seconds a buffered trade row waits before hitting disk; "
+             "checked every strategy tick (default: 5)"
+    )
+    parser.add_argument(
+        "--log-format",
+        choices=["csv", "msgpack", "arrow"],
+        default="csv",
+        help="Resolved-trade log format; binary formats write .mpk/.arrow next to --log-file "
+             "(convert with scripts/trades_to_csv.py). Default: csv"
+    )
+    parser.add_argument(
+        "--heartbeat-interval",
+        type=float,
+        default=25.0,
+        help="Seconds between app-level WS heartbeats, 0 disables (default: 25)"
+    )
+    parser.add_argument(
+        "--heartbeat-timeout",
+        type=float,
+        default=10.0,
+        help="Reconnect the WS if no heartbeat reply within this many seconds (default: 10)"
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -168,6 +204,12 @@ def main():
         print("  POLY_SAFE_ADDRESS   - Your Polymarket Safe wallet address")
         sys.exit(1)
 
+    # Heavy imports (web3, websockets, strategy) deferred until args and
+    # env are validated so --help and usage errors return immediately.
+    from src.bot import TradingBot
+    from src.config import Config
+    from strategies.contrarian import ContrarianStrategy, ContrarianConfig
+
     # Create bot
     config = Config.from_env()
     bot = TradingBot(config=config, private_key=private_key)
@@ -191,7 +233,12 @@ def main():
         min_volatility=args.min_volatility,
         observe_only=args.observe,
         log_file=args.log_file,
+        log_buffer_rows=args.log_buffer_rows,
+        log_flush_interval=args.log_flush_interval,
+        log_format=args.log_format,
         market_check_interval=market_check_interval,
+        heartbeat_interval=args.heartbeat_interval,
+        heartbeat_timeout=args.heartbeat_timeout,
         size=args.size,  # base class size
         kelly_fraction=args.kelly,
         estimated_win_rate=args.win_rate,
@@ -202,57 +249,69 @@ def main():
     # Print configuration
     mode_str = f"{Colors.YELLOW}OBSERVE ONLY{Colors.RESET}" if args.observe else f"{Colors.GREEN}LIVE TRADING{Colors.RESET}"
 
-    print(f"\n{Colors.BOLD}{'='*60}{Colors.RESET}")
-    print(f"{Colors.BOLD}  Contrarian Strategy - {strategy_config.coin} {strategy_config.timeframe} Markets{Colors.RESET}")
-    print(f"{Colors.BOLD}{'='*60}{Colors.RESET}\n")
-
-    print(f"  Mode:            {mode_str}")
-    print(f"  Coin:            {strategy_config.coin}")
-    print(f"  Timeframe:       {strategy_config.timeframe}")
-    print(f"  Max bet size:    ${strategy_config.bet_size:.2f} per trade")
-    print(f"  Entry range:     ${strategy_config.min_entry_price:.2f} - ${strategy_config.max_entry_price:.2f}")
-    print(f"  Max trades/hr:   {strategy_config.max_trades_per_hour}")
+    # Banner is assembled in memory and written once: a single syscall,
+    # and no interleaving when stdout is captured line-by-line.
+    banner = []
+    out = banner.append
+
+    out(f"\n{Colors.BOLD}{'='*60}{Colors.RESET}")
+    out(f"{Colors.BOLD}  Contrarian Strategy - {strategy_config.coin} {strategy_config.timeframe} Markets{Colors.RESET}")
+    out(f"{Colors.BOLD}{'='*60}{Colors.RESET}\n")
+
+    out(f"  Mode:            {mode_str}")
+    out(f"  Coin:            {strategy_config.coin}")
+    out(f"  Timeframe:       {strategy_config.timeframe}")
+    out(f"  Max bet size:    ${strategy_config.bet_size:.2f} per trade")
+    out(f"  Entry range:     ${strategy_config.min_entry_price:.2f} - ${strategy_config.max_entry_price:.2f}")
+    out(f"  Max trades/hr:   {strategy_config.max_trades_per_hour}")
     if strategy_config.daily_loss_limit > 0:
-        print(f"  Daily loss limit: ${strategy_config.daily_loss_limit:.2f}")
+        out(f"  Daily loss limit: ${strategy_config.daily_loss_limit:.2f}")
     else:
-        print(f"  Daily loss limit: disabled (Kelly manages risk)")
-    print(f"  Trade log:       {strategy_config.log_file}")
-    print()
+        out(f"  Daily loss limit: disabled (Kelly manages risk)")
+    out(f"  Trade log:       {strategy_config.log_file}")
+    out("")
 
-    # Kelly Criterion info
-    print(f"  Kelly Criterion Sizing:")
-    print(f"    Bankroll:      ${strategy_config.starting_bankroll:.2f}")
-    print(f"    Kelly fraction: {strategy_config.kelly_fraction:.0%} (fractional Kelly)")
-    print(f"    Est. win rate: {strategy_config.estimated_win_rate:.1%}")
-    print(f"    Max per trade: {strategy_config.max_bet_fraction:.0%} of bankroll")
+    # Sizing numbers shared by the Kelly and payout sections
     avg_entry = (strategy_config.min_entry_price + strategy_config.max_entry_price) / 2
-    kelly_f = strategy_config.kelly_fraction * (strategy_config.estimated_win_rate - avg_entry) / (1 - avg_entry)
-    sample_bet = kelly_f * strategy_config.starting_bankroll
-    print(f"    Sample bet:    ${max(sample_bet, 0):.2f} at ${avg_entry:.2f} entry")
-    print()
+    preview = sizing_preview(
+        strategy_config.estimated_win_rate,
+        avg_entry,
+        bankroll=strategy_config.starting_bankroll,
+        frac=strategy_config.kelly_fraction,
+    )
+
+    # Kelly Criterion info
+    out(f"  Kelly Criterion Sizing:")
+    out(f"    Bankroll:      ${strategy_config.starting_bankroll:.2f}")
+    out(f"    Kelly fraction: {strategy_config.kelly_fraction:.0%} (fractional Kelly)")
+    out(f"    Est. win rate: {strategy_config.estimated_win_rate:.1%}")
+    out(f"    Max per trade: {strategy_config.max_bet_fraction:.0%} of bankroll")
+    out(f"    Sample bet:    ${preview.bet:.2f} at ${avg_entry:.2f} entry")
+    out("")
 
     if not args.observe:
-        print(f"{Colors.YELLOW}  WARNING: This will place REAL trades with REAL money.{Colors.RESET}")
-        print(f"  Kelly will size bets dynamically based on bankroll + edge")
-        print(f"  Max risk per trade: ${min(strategy_config.bet_size, strategy_config.max_bet_fraction * strategy_config.starting_bankroll):.2f}")
-        print()
+        out(f"{Colors.YELLOW}  WARNING: This will place REAL trades with REAL money.{Colors.RESET}")
+        out(f"  Kelly will size bets dynamically based on bankroll + edge")
+        out(f"  Max risk per trade: ${min(strategy_config.bet_size, strategy_config.max_bet_fraction * strategy_config.starting_bankroll):.2f}")
+        out("")
 
     # Payout math
-    payout_mult = 1.0 / avg_entry
-    breakeven_wr = avg_entry * 100
+    out(f"  Strategy math (at avg entry ${avg_entry:.2f}):")
+    out(f"    Payout per win: {preview.payout_mult:.0f}x")
+    out(f"    Breakeven win rate: {preview.breakeven_wr:.1%}")
+    out(f"    Expected win rate (data): ~8-15%")
+    out("")
 
-    print(f"  Strategy math (at avg entry ${avg_entry:.2f}):")
-    print(f"    Payout per win: {payout_mult:.0f}x")
-    print(f"    Breakeven win rate: {breakeven_wr:.1f}%")
-    print(f"    Expected win rate (data): ~8-15%")
-    print()
+    sys.stdout.write("\n".join(banner) + "\n")
+    sys.stdout.flush()
 
     # Create and run strategy
     strategy = ContrarianStrategy(bot=bot, config=strategy_config)
 
     try:
-        asyncio.run(strategy.run())
+        run_main(strategy.run(), on_shutdown=strategy.request_stop)
     except KeyboardInterrupt:
+        strategy.logger.flush()
         print(f"\n{Colors.YELLOW}Interrupted by user{Colors.RESET}")
     except Exception as e:
         print(f"\n{Colors.RED}Error: {e}{Colors.RESET}")
@@ -21,7 +21,6 @@ Usage:
 """
 
 import argparse
-import asyncio
 import logging
 import sys
 from pathlib import Path
@@ -29,7 +28,7 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from strategies.copy_sniper import CopySniper, CopySniperConfig
+from lib.runtime import install_fast_loop, run_main
 
 
 def parse_args():
@@ -85,6 +84,14 @@ def parse_args():
         "--max-hours", type=float, default=24.0,
         help="Max hours to market resolution (default: 24). 0 = no filter.",
     )
+    parser.add_argument(
+        "--http-concurrency", type=int, default=32,
+        help="Max concurrent Data API connections when polling wallets (default: 32)",
+    )
+    parser.add_argument(
+        "--http2", action="store_true",
+        help="Multiplex Data API polling over HTTP/2 (requires httpx[http2])",
+    )
     parser.add_argument(
         "--live", action="store_true",
         help="Enable live trading (default: paper/observe only)",
@@ -97,6 +104,7 @@ def parse_args():
 
 
 def main():
+    install_fast_loop()
     args = parse_args()
 
     # Logging
@@ -107,6 +115,10 @@ def main():
         datefmt="%H:%M:%S",
     )
 
+    # Deferred: strategies.copy_sniper drags in the leaderboard/HTTP stack,
+    # which --help and arg errors shouldn't pay for.
+    from strategies.copy_sniper import CopySniper, CopySniperConfig
+
     config = CopySniperConfig(
         bankroll=args.bankroll,
         observe_only=not args.live,
@@ -121,6 +133,8 @@ def main():
         max_entry_price=args.max_entry,
         kelly_fraction=args.kelly,
         max_hours_to_resolution=args.max_hours,
+        http_concurrency=args.http_concurrency,
+        http2=args.http2,
     )
 
     if args.live:
@@ -130,7 +144,7 @@ def main():
     sniper = CopySniper(config)
 
     try:
-        asyncio.run(sniper.run())
+        run_main(sniper.run())
     except KeyboardInterrupt:
         print("\nShutdown requested.")
 
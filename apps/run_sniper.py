@@ -25,21 +25,10 @@ Usage:
 
 import os
 import sys
-import asyncio
 import argparse
 import logging
 from pathlib import Path
 
-# uvloop: drop-in replacement for asyncio's default event loop (~2-4x faster
-# on WS ingest + timer-heavy workloads). Install policy BEFORE any asyncio
-# context is created so the main loop picks it up.
-try:
-    import uvloop
-    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-    _UVLOOP_ACTIVE = True
-except ImportError:
-    _UVLOOP_ACTIVE = False
-
 # Fix Windows console encoding
 if sys.platform == "win32":
     os.environ.setdefault("PYTHONIOENCODING", "utf-8")
@@ -49,27 +38,36 @@ if sys.platform == "win32":
     except Exception:
         pass
 
-# Suppress noisy logs
-logging.getLogger("src.websocket_client").setLevel(logging.WARNING)
-logging.getLogger("src.bot").setLevel(logging.WARNING)
-logging.getLogger("websockets").setLevel(logging.WARNING)
-# Enable FastOrder timing logs (sign/net breakdown)
-logging.getLogger("lib.fast_order").setLevel(logging.INFO)
-
-# Auto-load .env
-from dotenv import load_dotenv
-load_dotenv()
+# Logger levels, applied in one place before any module creates children:
+# quiet the noisy WS/bot logs, keep FastOrder timing (sign/net breakdown).
+LOG_LEVELS = {
+    "src.websocket_client": logging.WARNING,
+    "src.bot": logging.WARNING,
+    "websockets": logging.WARNING,
+    "lib.fast_order": logging.INFO,
+}
+for _name, _level in LOG_LEVELS.items():
+    logging.getLogger(_name).setLevel(_level)
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from lib.runtime import install_fast_loop, load_env_file, run_main
+
+# Auto-load .env (never overrides variables already exported)
+load_env_file()
+
 from lib.console import Colors
-from src.bot import TradingBot
-from src.config import Config
-from strategies.momentum_sniper import MomentumSniperStrategy, SniperConfig
+from lib.sizing import sizing_preview
+
+# Coins with a price feed + Polymarket up/down markets (display order)
+SUPPORTED_COINS = ("BTC", "ETH", "SOL", "XRP", "DOGE", "HYPE", "BNB")
+_VALID_COINS = frozenset(SUPPORTED_COINS)
 
 
 def main():
+    loop_name = install_fast_loop()
+
     parser = argparse.ArgumentParser(
         description="Momentum Sniper for Polymarket crypto binary markets"
     )
@@ -208,6 +206,28 @@ def main():
         "--log-file", type=str, default="data/longshot_trades.csv",
         help="Trade log CSV file (default: data/longshot_trades.csv)"
     )
+    parser.add_argument(
+        "--log-buffer-rows", type=int, default=32,
+        help="Resolved trades buffered before appending to the CSV (default: 32)"
+    )
+    parser.add_argument(
+        "--log-flush-interval", type=float, default=5.0,
+        help="Max seconds a buffered trade row waits before hitting disk; "
+             "checked every strategy tick (default: 5)"
+    )
+    parser.add_argument(
+        "--log-format", choices=["csv", "msgpack", "arrow"], default="csv",
+        help="Resolved-trade log format; binary formats write .mpk/.arrow next to --log-file "
+             "(convert with scripts/trades_to_csv.py). Default: csv"
+    )
+    parser.add_argument(
+        "--heartbeat-interval", type=float, default=25.0,
+        help="Seconds between app-level WS heartbeats, 0 disables (default: 25)"
+    )
+    parser.add_argument(
+        "--heartbeat-timeout", type=float, default=10.0,
+        help="Reconnect the WS if no heartbeat reply within this many seconds (default: 10)"
+    )
     parser.add_argument(
         "--debug", action="store_true",
         help="Enable debug logging"
@@ -423,29 +443,28 @@ def main():
         logging.basicConfig(level=logging.DEBUG)
 
     # Validate coins
-    valid_coins = ["BTC", "ETH", "SOL", "XRP", "DOGE", "HYPE", "BNB"]
-    coins = [c.upper() for c in args.coins]
-    for c in coins:
-        if c not in valid_coins:
-            print(f"{Colors.RED}Invalid coin: {c}. Options: {valid_coins}{Colors.RESET}")
-            sys.exit(1)
+    coins = tuple(map(str.upper, args.coins))
+    bad = [c for c in coins if c not in _VALID_COINS]
+    if bad:
+        print(f"{Colors.RED}Invalid coin: {', '.join(bad)}. Options: {list(SUPPORTED_COINS)}{Colors.RESET}")
+        sys.exit(1)
 
     # Validate kelly-coins (must be subset of --coins)
-    kelly_coins = [c.upper() for c in args.kelly_coins]
+    kelly_coins = tuple(map(str.upper, args.kelly_coins))
     for c in kelly_coins:
         if c not in coins:
-            print(f"{Colors.RED}Error: --kelly-coins {c} not in --coins list ({coins}){Colors.RESET}")
+            print(f"{Colors.RED}Error: --kelly-coins {c} not in --coins list ({list(coins)}){Colors.RESET}")
             sys.exit(1)
 
-    # Parse blocked hours
-    blocked_hours = []
+    # Parse blocked hours into a 24-bit mask (bit h = skip UTC hour h)
+    blocked_hours_mask = 0
     if args.block_hours:
         try:
-            blocked_hours = [int(h.strip()) for h in args.block_hours.split(",")]
-            for h in blocked_hours:
+            for h in (int(h.strip()) for h in args.block_hours.split(",")):
                 if h < 0 or h > 23:
                     print(f"{Colors.RED}Error: --block-hours must be 0-23, got {h}{Colors.RESET}")
                     sys.exit(1)
+                blocked_hours_mask |= 1 << h
         except ValueError:
             print(f"{Colors.RED}Error: --block-hours must be comma-separated integers{Colors.RESET}")
             sys.exit(1)
@@ -459,6 +478,12 @@ def main():
         print("Set them in .env file or export as environment variables")
         sys.exit(1)
 
+    # Heavy imports (web3, websockets, strategy) deferred until args and
+    # env are validated so --help and usage errors return immediately.
+    from src.bot import TradingBot
+    from src.config import Config
+    from strategies.momentum_sniper import MomentumSniperStrategy, SniperConfig, TAKER_FEE_RATES
+
     # Create bot
     config = Config.from_env()
     bot = TradingBot(config=config, private_key=private_key)
@@ -486,7 +511,7 @@ def main():
         min_size_mode=args.min_size,
         min_size_tokens=args.min_size_tokens,
         kelly_coins=kelly_coins,
-        blocked_hours=blocked_hours,
+        blocked_hours_mask=blocked_hours_mask,
         max_volatility=args.max_vol,
         fixed_volatility=args.fixed_vol,
         min_momentum=args.min_momentum,
@@ -495,6 +520,8 @@ def main():
         min_window_elapsed=args.min_window_elapsed,
         max_window_elapsed=args.max_window_elapsed,
         market_check_interval=args.market_check_interval,
+        heartbeat_interval=args.heartbeat_interval,
+        heartbeat_timeout=args.heartbeat_timeout,
         price_source=args.price_source,
         use_vatic=not args.no_vatic,
         require_vatic=args.require_vatic,
@@ -502,6 +529,9 @@ def main():
         direct_fv_calibration=args.direct_fv_calibration,
         observe_only=args.observe,
         log_file=args.log_file,
+        log_buffer_rows=args.log_buffer_rows,
+        log_flush_interval=args.log_flush_interval,
+        log_format=args.log_format,
         fok_tolerance=args.fok_tolerance,
         max_spread=args.max_spread,
         btc_block_entry=args.btc_block_entry,
@@ -545,22 +575,27 @@ def main():
     # Print config
     mode = f"{Colors.YELLOW}OBSERVE ONLY{Colors.RESET}" if args.observe else f"{Colors.GREEN}LIVE TRADING{Colors.RESET}"
 
-    print(f"\n{'='*60}")
-    print(f"  MOMENTUM SNIPER — {'/'.join(coins)} {args.timeframe}")
-    print(f"{'='*60}\n")
+    # Banner is assembled in memory and written once: a single syscall,
+    # and no interleaving when stdout is captured line-by-line.
+    banner = []
+    out = banner.append
+
+    out(f"\n{'='*60}")
+    out(f"  MOMENTUM SNIPER — {'/'.join(coins)} {args.timeframe}")
+    out(f"{'='*60}\n")
     if args.price_source == "chainlink":
         price_src = f"{Colors.CYAN}CHAINLINK (settlement source){Colors.RESET}"
     else:
         price_src = "Binance"
     if "HYPE" in coins:
         price_src += f" + {Colors.CYAN}Coinbase (HYPE){Colors.RESET}"
-    print(f"  Mode:           {mode}")
-    print(f"  Coins:          {', '.join(coins)}")
-    print(f"  Timeframe:      {args.timeframe}")
-    print(f"  Price source:   {price_src}")
+    out(f"  Mode:           {mode}")
+    out(f"  Coins:          {', '.join(coins)}")
+    out(f"  Timeframe:      {args.timeframe}")
+    out(f"  Price source:   {price_src}")
     vatic_status = f"{Colors.GREEN}ON (exact Chainlink strikes){Colors.RESET}" if not args.no_vatic else "OFF"
-    print(f"  Vatic strikes:  {vatic_status}")
-    print(f"  Bankroll:       ${args.bankroll:.2f}")
+    out(f"  Vatic strikes:  {vatic_status}")
+    out(f"  Bankroll:       ${args.bankroll:.2f}")
     side_displays = {
         "up": f"{Colors.GREEN}UP-ONLY{Colors.RESET}",
         "down": f"{Colors.RED}DOWN-ONLY{Colors.RESET}",
@@ -568,76 +603,75 @@ def main():
         "trend": f"{Colors.CYAN}EMA TREND ({args.ema_fast},{args.ema_slow}){Colors.RESET}",
     }
     side_display = side_displays.get(args.side, args.side)
-    print(f"  Side filter:    {side_display}")
+    out(f"  Side filter:    {side_display}")
     weekend_status = f"{Colors.GREEN}BLOCKED{Colors.RESET}" if args.block_weekends else "Trading"
-    print(f"  Weekends:       {weekend_status}")
+    out(f"  Weekends:       {weekend_status}")
     if args.edge_model:
-        print(f"  Edge model:     {Colors.CYAN}{args.edge_model}{Colors.RESET}")
-        print(f"  Min edge:       {args.min_edge_pct:.0%}")
+        out(f"  Edge model:     {Colors.CYAN}{args.edge_model}{Colors.RESET}")
+        out(f"  Min edge:       {args.min_edge_pct:.0%}")
     else:
-        print(f"  Edge model:     OFF")
-    print()
+        out(f"  Edge model:     OFF")
+    out("")
 
     # Fee info
-    from strategies.momentum_sniper import TAKER_FEE_RATES
     fee_rate = TAKER_FEE_RATES.get(args.timeframe, 0.0)
     if fee_rate > 0:
         max_fee_pct = fee_rate * 0.25 * 100  # max at p=0.50
-        print(f"  Taker Fee:      {max_fee_pct:.2f}% max (at 50c entry)")
+        out(f"  Taker Fee:      {max_fee_pct:.2f}% max (at 50c entry)")
     else:
-        print(f"  Taker Fee:      NONE (fee-free market)")
-    print()
+        out(f"  Taker Fee:      NONE (fee-free market)")
+    out("")
 
     # Edge info
-    print(f"  Edge Thresholds (net, after fees):")
-    print(f"    Min edge:     {args.min_edge:.2f} ({args.min_edge*100:.0f} cents)")
-    print(f"    Strong edge:  {args.strong_edge:.2f} ({args.strong_edge*100:.0f} cents)")
-    print()
+    out(f"  Edge Thresholds (net, after fees):")
+    out(f"    Min edge:     {args.min_edge:.2f} ({args.min_edge*100:.0f} cents)")
+    out(f"    Strong edge:  {args.strong_edge:.2f} ({args.strong_edge*100:.0f} cents)")
+    out("")
 
     # Position sizing info
     if args.min_size:
-        print(f"  Position Sizing: MINIMUM SIZE MODE (conservative)")
-        print(f"    Every trade: 5 tokens (Polymarket minimum)")
-        print(f"    Cost per trade: ~$1.00-$4.25 depending on entry price")
-        print(f"    Purpose: gather data on whether edge is real")
-        print()
-        print(f"  Example trade (10c edge):")
-        print(f"    Buy 5 tokens at $0.40 = $2.00 cost")
-        print(f"    Win: $5.00 payout (+$3.00 profit)")
-        print(f"    Loss: $0.00 payout (-$2.00 loss)")
+        out(f"  Position Sizing: MINIMUM SIZE MODE (conservative)")
+        out(f"    Every trade: 5 tokens (Polymarket minimum)")
+        out(f"    Cost per trade: ~$1.00-$4.25 depending on entry price")
+        out(f"    Purpose: gather data on whether edge is real")
+        out("")
+        out(f"  Example trade (10c edge):")
+        out(f"    Buy 5 tokens at $0.40 = $2.00 cost")
+        out(f"    Win: $5.00 payout (+$3.00 profit)")
+        out(f"    Loss: $0.00 payout (-$2.00 loss)")
     else:
-        print(f"  Position Sizing (Kelly Criterion):")
-        print(f"    Normal Kelly: {args.kelly:.0%}")
-        print(f"    Strong Kelly: {args.kelly_strong:.0%}")
-        print(f"    Max per trade: {args.max_bet_fraction:.0%} of bankroll (${args.max_bet_fraction * args.bankroll:.2f})")
-        print(f"    Min per trade: $1.00 (Polymarket floor)")
-        print()
-        ex_price = 0.40
-        ex_fair = 0.50
-        b = (1.0 / ex_price) - 1.0
-        kelly_f = (ex_fair * b - 0.50) / b
-        ex_bet = kelly_f * args.kelly * args.bankroll
-        print(f"  Example trade (10c edge):")
-        print(f"    Buy at $0.40, fair value $0.50")
-        print(f"    Payout if win: ${1.0/ex_price:.2f} per token (2.5x)")
-        print(f"    Kelly fraction: {kelly_f:.3f}, bet = ${max(1.0, ex_bet):.2f}")
-    print()
-
-    print(f"  Auto-redeems winning tokens to USDC on every market settlement")
-    print()
+        out(f"  Position Sizing (Kelly Criterion):")
+        out(f"    Normal Kelly: {args.kelly:.0%}")
+        out(f"    Strong Kelly: {args.kelly_strong:.0%}")
+        out(f"    Max per trade: {args.max_bet_fraction:.0%} of bankroll (${args.max_bet_fraction * args.bankroll:.2f})")
+        out(f"    Min per trade: $1.00 (Polymarket floor)")
+        out("")
+        ex = sizing_preview(0.50, 0.40, bankroll=args.bankroll, frac=args.kelly)
+        out(f"  Example trade (10c edge):")
+        out(f"    Buy at $0.40, fair value $0.50")
+        out(f"    Payout if win: ${ex.payout_mult:.2f} per token (2.5x)")
+        out(f"    Kelly fraction: {ex.kelly_f:.3f}, bet = ${max(1.0, ex.bet):.2f}")
+    out("")
+
+    out(f"  Auto-redeems winning tokens to USDC on every market settlement")
+    out("")
 
     if not args.observe:
-        print(f"{Colors.YELLOW}  WARNING: This will place REAL orders with REAL money.{Colors.RESET}")
-        print(f"  Starting with ${args.bankroll:.2f} USDC.")
-        print()
+        out(f"{Colors.YELLOW}  WARNING: This will place REAL orders with REAL money.{Colors.RESET}")
+        out(f"  Starting with ${args.bankroll:.2f} USDC.")
+        out("")
 
-    strategy = MomentumSniperStrategy(bot=bot, config=strategy_config)
+    out(f"  Event loop: {loop_name}")
 
-    print(f"  Event loop: {'uvloop' if _UVLOOP_ACTIVE else 'asyncio (default)'}")
+    sys.stdout.write("\n".join(banner) + "\n")
+    sys.stdout.flush()
+
+    strategy = MomentumSniperStrategy(bot=bot, config=strategy_config)
 
     try:
-        asyncio.run(strategy.run())
+        run_main(strategy.run(), on_shutdown=strategy.request_stop)
     except KeyboardInterrupt:
+        strategy.trade_logger.flush()
         print(f"\n{Colors.YELLOW}Interrupted by user{Colors.RESET}")
     except Exception as e:
         print(f"\n{Colors.RED}Error: {e}{Colors.RESET}")
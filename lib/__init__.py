@@ -17,22 +17,35 @@ Usage:
     from lib.volatility_tracker import VolatilityTracker
 """
 
-from lib.console import Colors
-from lib.market_manager import MarketManager, MarketInfo
-from lib.price_tracker import PriceTracker, PricePoint, FlashCrashEvent
-from lib.position_manager import PositionManager, Position
-from lib.trade_logger import TradeLogger
-from lib.volatility_tracker import VolatilityTracker
-
-__all__ = [
-    "Colors",
-    "MarketManager",
-    "MarketInfo",
-    "PriceTracker",
-    "PricePoint",
-    "FlashCrashEvent",
-    "PositionManager",
-    "Position",
-    "TradeLogger",
-    "VolatilityTracker",
-]
+import importlib
+
+# Re-exports are resolved lazily (PEP 562) so that importing a light
+# submodule such as lib.console or lib.runtime does not drag in the
+# websocket / web3 stack behind MarketManager.
+_EXPORTS = {
+    "Colors": "lib.console",
+    "MarketManager": "lib.market_manager",
+    "MarketInfo": "lib.market_manager",
+    "PriceTracker": "lib.price_tracker",
+    "PricePoint": "lib.price_tracker",
+    "FlashCrashEvent": "lib.price_tracker",
+    "PositionManager": "lib.position_manager",
+    "Position": "lib.position_manager",
+    "TradeLogger": "lib.trade_logger",
+    "VolatilityTracker": "lib.volatility_tracker",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'lib' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
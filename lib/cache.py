@@ -0,0 +1,94 @@
+"""
+File Cache - Persistent TTL cache for JSON API responses.
+
+Each entry is one JSON file named by a hash of (endpoint, params):
+
+    {"ts": <unix time written>, "ttl": <seconds>, "data": <payload>}
+
+An in-memory layer sits on top, so a repeated read inside the TTL costs
+no disk IO. Entries survive restarts, so a bot that is relaunched does
+not re-pull every leaderboard on startup.
+
+Usage:
+    cache = FileCache(".cache/data_api")
+    key = FileCache.key("/v1/leaderboard", {"category": "SPORTS"})
+    data = cache.get(key)
+    if data is None:
+        data = fetch()
+        cache.set(key, data, ttl=60.0)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class FileCache:
+    """JSON-on-disk TTL cache with an in-memory front."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        # key -> (expires_at, data)
+        self._mem: Dict[str, Tuple[float, Any]] = {}
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[dict] = None) -> str:
+        """Stable key for an endpoint + params (param order doesn't matter)."""
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        raw = json.dumps([endpoint, items], separators=(",", ":"))
+        return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def peek(self, key: str) -> Optional[Any]:
+        """In-memory lookup only (no disk IO); None if missing or expired."""
+        hit = self._mem.get(key)
+        if hit is not None and time.time() < hit[0]:
+            return hit[1]
+        return None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached payload, or None if missing or expired."""
+        now = time.time()
+        hit = self._mem.get(key)
+        if hit is not None:
+            if now < hit[0]:
+                return hit[1]
+            del self._mem[key]
+
+        try:
+            with open(self._path(key), "r") as f:
+                entry = json.load(f)
+            expires_at = entry["ts"] + entry["ttl"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Unreadable cache entry {key}: {e}")
+            return None
+
+        if now >= expires_at:
+            return None
+        self._mem[key] = (expires_at, entry["data"])
+        return entry["data"]
+
+    def set(self, key: str, data: Any, ttl: float) -> None:
+        """Store a payload for `ttl` seconds (memory + disk)."""
+        now = time.time()
+        self._mem[key] = (now + ttl, data)
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w") as f:
+                json.dump({"ts": now, "ttl": ttl, "data": data}, f)
+            # Atomic swap so a concurrent reader never sees a partial file
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Failed to write cache entry {key}: {e}")
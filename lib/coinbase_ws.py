@@ -24,7 +24,7 @@ import time
 import logging
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Deque
+from typing import Dict, Optional, Deque, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -50,21 +50,14 @@ PRODUCT_TO_COIN = {v: k for k, v in COINBASE_SYMBOLS.items()}
 SECONDS_PER_YEAR = 365.25 * 24 * 3600
 
 
-@dataclass
-class PricePoint:
-    """A single price observation."""
-    price: float
-    timestamp: float  # Unix timestamp
-
-
 @dataclass
 class CoinState:
     """Tracks price and volatility state for a single coin."""
     symbol: str
     price: float = 0.0
     last_update: float = 0.0
-    # Rolling price history for volatility calculation
-    history: Deque[PricePoint] = field(default_factory=lambda: deque(maxlen=600))
+    # Rolling (price, timestamp) samples for volatility calculation
+    history: Deque[Tuple[float, float]] = field(default_factory=lambda: deque(maxlen=600))
     # Cached volatility (recalculated periodically)
     _cached_vol: float = 0.50  # Default 50% annualized
     _vol_calc_time: float = 0.0
@@ -172,12 +165,12 @@ class CoinbasePriceFeed:
         # Find the most recent price at or before the cutoff time
         cutoff = time.time() - lookback_seconds
         past_price = None
-        for point in state.history:
-            if point.timestamp <= cutoff:
-                past_price = point.price
+        for p, ts in state.history:
+            if ts <= cutoff:
+                past_price = p
         # If no point old enough, use the oldest available
         if past_price is None and state.history:
-            past_price = state.history[0].price
+            past_price = state.history[0][0]
         if not past_price or past_price <= 0:
             return 0.0
 
@@ -194,10 +187,12 @@ class CoinbasePriceFeed:
         # Calculate log returns between consecutive samples
         returns = []
         for i in range(1, len(points)):
-            if points[i - 1].price > 0 and points[i].price > 0:
-                dt = points[i].timestamp - points[i - 1].timestamp
+            p0, t0 = points[i - 1]
+            p1, t1 = points[i]
+            if p0 > 0 and p1 > 0:
+                dt = t1 - t0
                 if dt > 0:
-                    log_ret = math.log(points[i].price / points[i - 1].price)
+                    log_ret = math.log(p1 / p0)
                     returns.append((log_ret, dt))
 
         if len(returns) < 5:
@@ -319,7 +314,7 @@ class CoinbasePriceFeed:
 
                 # Sample for volatility calculation
                 if ts - self._last_sample.get(coin, 0) >= self.vol_sample_interval:
-                    state.history.append(PricePoint(price=price, timestamp=ts))
+                    state.history.append((price, ts))
                     self._last_sample[coin] = ts
 
                 # Fire price callbacks for instant signal detection
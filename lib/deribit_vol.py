@@ -16,10 +16,14 @@ Usage:
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 
+import orjson
 import requests
 
+from src.http import CircuitBreaker, ThreadLocalSessionMixin, pooled_session
+
 logger = logging.getLogger(__name__)
 
 # Deribit DVOL index names per coin
@@ -30,23 +34,56 @@ DVOL_INDEX_NAMES: Dict[str, str] = {
 
 DERIBIT_API_BASE = "https://www.deribit.com/api/v2/public"
 
+# Full DVOL request URL per coin, built once
+DVOL_URLS: Dict[str, str] = {
+    coin: f"{DERIBIT_API_BASE}/get_index_price?index_name={name}"
+    for coin, name in DVOL_INDEX_NAMES.items()
+}
+
+# Sanity range for DVOL as a decimal (10% .. 300% annualized)
+DVOL_MIN = 0.10
+DVOL_MAX = 3.0
 
-class DeribitVolFeed:
+# Per-request timeout; short so an outage fails fast
+REQUEST_TIMEOUT = 2.0
+
+
+class DeribitVolFeed(ThreadLocalSessionMixin):
     """
     Fetches implied volatility from Deribit DVOL index.
 
     - Caches results for cache_ttl seconds (default: 60)
+    - A stale entry refreshes every configured coin at once, one GET per
+      coin in parallel over keep-alive sessions (Deribit has no bulk DVOL
+      endpoint), so N coins cost one round trip instead of N
     - Returns None on any error (caller falls back to Binance realized vol)
+    - After 3 consecutive failed refreshes, skips Deribit for 30s
     - Only supports BTC and ETH (the coins Viper v2 trades)
     """
 
     def __init__(self, coins: list, cache_ttl: float = 60.0):
+        super().__init__()
         self.coins = [c.upper() for c in coins]
         self.cache_ttl = cache_ttl
 
         # Cache: coin -> (vol, timestamp)
         self._cache: Dict[str, tuple] = {}
 
+        # Worker pool for parallel fetches (created on first multi-coin refresh)
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+        # Opens after repeated failed refreshes so an outage costs no HTTP
+        self._breaker = CircuitBreaker(max_failures=3, cooldown=30.0)
+
+    def _new_session(self) -> requests.Session:
+        return pooled_session()
+
+    def close(self) -> None:
+        """Shut down the fetch worker pool (a later refresh recreates it)."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
     def get_implied_vol(self, coin: str) -> Optional[float]:
         """
         Get Deribit implied vol for a coin.
@@ -66,12 +103,44 @@ class DeribitVolFeed:
             if time.time() - ts < self.cache_ttl:
                 return vol
 
-        # Fetch fresh
-        vol = self._fetch_dvol(coin)
-        if vol is not None:
-            self._cache[coin] = (vol, time.time())
+        # Fetch fresh (every configured coin, not just this one)
+        return self._fetch_all(coin).get(coin)
 
-        return vol
+    def _fetch_all(self, coin: str) -> Dict[str, float]:
+        """
+        Refresh DVOL for `coin` plus every other supported configured coin.
+
+        The GETs run in parallel and the cache is updated in a single pass.
+        Returns the coins that fetched successfully; failed coins keep
+        their previous cache entry. Returns {} without any HTTP while the
+        circuit breaker is open.
+        """
+        if not self._breaker.allow():
+            return {}
+
+        coins = [c for c in self.coins if c in DVOL_INDEX_NAMES]
+        if coin not in coins:
+            coins.append(coin)
+
+        if len(coins) == 1:
+            vols = [self._fetch_dvol(coin)]
+        else:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=len(coins), thread_name_prefix="deribit-dvol"
+                )
+            vols = list(self._pool.map(self._fetch_dvol, coins))
+
+        now = time.time()
+        fresh = {c: v for c, v in zip(coins, vols) if v is not None}
+        if fresh:
+            self._breaker.record_success()
+        elif self._breaker.record_failure():
+            logger.warning(
+                "Deribit DVOL unavailable, skipping for %.0fs", self._breaker.cooldown
+            )
+        self._cache.update((c, (v, now)) for c, v in fresh.items())
+        return fresh
 
     def _fetch_dvol(self, coin: str) -> Optional[float]:
         """
@@ -79,38 +148,36 @@ class DeribitVolFeed:
 
         Returns annualized vol as decimal, or None on any error.
         """
-        index_name = DVOL_INDEX_NAMES.get(coin)
-        if not index_name:
+        url = DVOL_URLS.get(coin)
+        if not url:
             return None
 
         try:
-            url = f"{DERIBIT_API_BASE}/get_index_price?index_name={index_name}"
-            response = requests.get(url, timeout=5)
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             dvol_pct = data["result"]["index_price"]
 
             # DVOL is in percentage points (e.g., 51.92 = 51.92%)
             # Convert to decimal for Black-Scholes (0.5192)
             vol = dvol_pct / 100.0
 
-            # Sanity check: vol should be between 10% and 300%
-            if vol < 0.10 or vol > 3.0:
-                logger.warning(f"Deribit DVOL {coin} out of range: {dvol_pct:.1f}%")
+            if vol < DVOL_MIN or vol > DVOL_MAX:
+                logger.warning("Deribit DVOL %s out of range: %.1f%%", coin, dvol_pct)
                 return None
 
             return vol
 
         except requests.Timeout:
-            logger.debug(f"Deribit DVOL timeout for {coin}")
+            logger.debug("Deribit DVOL timeout for %s", coin)
             return None
         except requests.RequestException as e:
-            logger.debug(f"Deribit DVOL request failed for {coin}: {e}")
+            logger.debug("Deribit DVOL request failed for %s: %s", coin, e)
             return None
         except (KeyError, TypeError, ValueError) as e:
-            logger.debug(f"Deribit DVOL parse error for {coin}: {e}")
+            logger.debug("Deribit DVOL parse error for %s: %s", coin, e)
             return None
         except Exception as e:
-            logger.debug(f"Deribit DVOL unexpected error for {coin}: {e}")
+            logger.debug("Deribit DVOL unexpected error for %s: %s", coin, e)
             return None
@@ -6,30 +6,69 @@ Endpoints:
   - GET /activity         — on-chain activity for a user
   - GET /positions        — current open positions for a user
   - GET /trades           — trades for a user or markets
+
+Each read has a blocking form (requests) and an `_async` form that fans out
+over a pooled aiohttp session opened with open_session(). With
+open_session(http2=True) and httpx[http2] installed, the `_async` reads
+are multiplexed over HTTP/2 instead.
+
+Positions are also available column-wise (get_positions_columns) as NumPy
+arrays, for rollups/filters across many wallets without per-row objects.
+
+Leaderboard/positions responses can be cached on disk (opt-in, pass
+cache_dir, e.g. DEFAULT_CACHE_DIR); the `_async` reads do the cache's disk
+IO off the event loop.
 """
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+import orjson  # faster than resp.json() on multi-KB payloads
 import requests
 
+from lib.cache import FileCache
+from src.http import ThreadLocalSessionMixin, pooled_session
+
 logger = logging.getLogger(__name__)
 
 DATA_API = "https://data-api.polymarket.com"
 
+# Full URL per endpoint, built once instead of per request
+ENDPOINT_URLS: Dict[str, str] = {
+    path: f"{DATA_API}{path}"
+    for path in ("/v1/leaderboard", "/activity", "/positions", "/trades")
+}
+
 # Valid categories for leaderboard
-CATEGORIES = [
+CATEGORIES = (
     "OVERALL", "POLITICS", "SPORTS", "CRYPTO", "CULTURE",
     "MENTIONS", "WEATHER", "ECONOMICS", "TECH", "FINANCE",
-]
+)
 
 # Categories we care about for copy-trading (skip crypto — proven unprofitable)
-COPY_CATEGORIES = ["SPORTS", "POLITICS", "ECONOMICS", "CULTURE", "TECH", "FINANCE"]
+COPY_CATEGORIES = ("SPORTS", "POLITICS", "ECONOMICS", "CULTURE", "TECH", "FINANCE")
+
+# Response cache TTL per endpoint (seconds). /activity is deliberately not
+# cached: the copy-trader polls it for new buys and needs every fill live.
+CACHE_TTLS: Dict[str, float] = {
+    "/v1/leaderboard": 60.0,
+    "/positions": 30.0,
+}
 
+# Max Data API requests in flight at once per client (all `_async` reads
+# share it), keeping bursts under the API rate limit
+MAX_CONCURRENCY = 3
 
-@dataclass
+# Project-root cache dir, independent of the caller's working directory
+DEFAULT_CACHE_DIR = str(Path(__file__).resolve().parent.parent / ".cache" / "data_api")
+
+
+@dataclass(slots=True)
 class LeaderboardEntry:
     rank: int
     address: str
@@ -40,7 +79,7 @@ class LeaderboardEntry:
     time_period: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeActivity:
     wallet: str
     timestamp: int
@@ -59,7 +98,7 @@ class TradeActivity:
     tx_hash: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     wallet: str
     asset: str             # token_id
@@ -81,24 +120,160 @@ class Position:
     redeemable: bool
 
 
-class PolymarketDataAPI:
-    """Wrapper for Polymarket Data API (data-api.polymarket.com)."""
+# Position columns: attribute name -> API field, split by dtype
+POSITION_FLOAT_COLUMNS: Dict[str, str] = {
+    "size": "size",
+    "avg_price": "avgPrice",
+    "initial_value": "initialValue",
+    "current_value": "currentValue",
+    "cash_pnl": "cashPnl",
+    "percent_pnl": "percentPnl",
+    "realized_pnl": "realizedPnl",
+    "cur_price": "curPrice",
+}
+POSITION_TEXT_COLUMNS: Dict[str, str] = {
+    "wallet": "proxyWallet",
+    "asset": "asset",
+    "condition_id": "conditionId",
+    "title": "title",
+    "slug": "slug",
+    "event_slug": "eventSlug",
+    "outcome": "outcome",
+    "end_date": "endDate",
+}
+
+
+def _num(v: Any) -> float:
+    """JSON number as-is; strings/None are converted (None -> 0.0)."""
+    return v if isinstance(v, (int, float)) else float(v or 0)
+
+
+def _parse_leaderboard(data: Any, category: str, time_period: str) -> List[LeaderboardEntry]:
+    entries = []
+    for item in data:
+        entries.append(LeaderboardEntry(
+            rank=int(item.get("rank", 0)),
+            address=item.get("proxyWallet", ""),
+            username=item.get("userName", ""),
+            pnl=_num(item.get("pnl")),
+            volume=_num(item.get("vol")),
+            category=category,
+            time_period=time_period,
+        ))
+    return entries
 
-    def __init__(self, timeout: int = 15):
+
+def _parse_activity(data: Any) -> List[TradeActivity]:
+    activities = []
+    for item in data:
+        activities.append(TradeActivity(
+            wallet=item.get("proxyWallet", ""),
+            timestamp=int(item.get("timestamp", 0)),
+            condition_id=item.get("conditionId", ""),
+            trade_type=item.get("type", ""),
+            side=item.get("side", ""),
+            size=_num(item.get("size")),
+            usdc_size=_num(item.get("usdcSize")),
+            price=_num(item.get("price")),
+            asset=item.get("asset", ""),
+            outcome=item.get("outcome", ""),
+            outcome_index=int(item.get("outcomeIndex", 0)),
+            title=item.get("title", ""),
+            slug=item.get("slug", ""),
+            event_slug=item.get("eventSlug", ""),
+            tx_hash=item.get("transactionHash", ""),
+        ))
+    return activities
+
+
+def _activity_params(
+    user: str,
+    trade_type: str,
+    side: Optional[str],
+    start: Optional[int],
+    limit: int,
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {
+        "user": user,
+        "type": trade_type,
+        "limit": limit,
+        "sortBy": "TIMESTAMP",
+        "sortDirection": "DESC",
+    }
+    if side:
+        params["side"] = side
+    if start:
+        params["start"] = start
+    return params
+
+
+def _positions_params(user: str, limit: int, sort_by: str) -> Dict[str, Any]:
+    return {
+        "user": user,
+        "limit": limit,
+        "sortBy": sort_by,
+        "sortDirection": "DESC",
+        "sizeThreshold": 1,
+    }
+
+
+class PolymarketDataAPI(ThreadLocalSessionMixin):
+    """
+    Wrapper for Polymarket Data API (data-api.polymarket.com).
+
+    Blocking calls share a pooled keep-alive requests.Session per thread
+    (`self.session`); the `_async` calls use the aiohttp session.
+    """
+
+    def __init__(
+        self,
+        timeout: int = 15,
+        cache_dir: Optional[str] = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ):
+        """
+        Args:
+            timeout: Request timeout in seconds
+            cache_dir: Directory for the on-disk response cache (CACHE_TTLS),
+                e.g. DEFAULT_CACHE_DIR; None (default) disables caching
+            max_concurrency: Max `_async` requests in flight at once
+        """
+        super().__init__()
         self.timeout = timeout
+        self._session = None  # aiohttp.ClientSession / httpx.AsyncClient, see open_session()
+        self._http2 = False
+        self._cache = FileCache(cache_dir) if cache_dir else None
+        self._inflight = asyncio.Semaphore(max(1, max_concurrency))
+
+    def _new_session(self) -> requests.Session:
+        return pooled_session()
+
+    def _cache_key(self, path: str, params: dict) -> Optional[str]:
+        """Cache key for a request, or None when caching doesn't apply."""
+        if self._cache is None or path not in CACHE_TTLS:
+            return None
+        return FileCache.key(path, params)
 
     def _get(self, path: str, params: dict) -> Any:
-        """Make GET request and return JSON."""
-        url = f"{DATA_API}{path}"
+        """Make GET request and return JSON (served from cache when fresh)."""
+        key = self._cache_key(path, params)
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        url = ENDPOINT_URLS.get(path) or f"{DATA_API}{path}"
         try:
-            resp = requests.get(url, params=params, timeout=self.timeout)
+            resp = self.session.get(url, params=params, timeout=self.timeout)
             if resp.status_code != 200:
                 logger.warning(f"API {path} returned {resp.status_code}: {resp.text[:200]}")
                 return []
-            return resp.json()
+            data = orjson.loads(resp.content)
         except Exception as e:
             logger.error(f"API error {path}: {e}")
             return []
+        if key is not None:
+            self._cache.set(key, data, CACHE_TTLS[path])
+        return data
 
     # ------------------------------------------------------------------
     # Leaderboard
@@ -120,28 +295,17 @@ class PolymarketDataAPI:
             "limit": limit,
             "offset": offset,
         })
-
-        entries = []
-        for item in data:
-            entries.append(LeaderboardEntry(
-                rank=int(item.get("rank", 0)),
-                address=item.get("proxyWallet", ""),
-                username=item.get("userName", ""),
-                pnl=float(item.get("pnl", 0)),
-                volume=float(item.get("vol", 0)),
-                category=category,
-                time_period=time_period,
-            ))
-        return entries
+        return _parse_leaderboard(data, category, time_period)
 
     def get_top_traders_all_categories(
         self,
         time_period: str = "WEEK",
         limit_per_category: int = 10,
+        categories: Optional[List[str]] = None,
     ) -> Dict[str, List[LeaderboardEntry]]:
         """Get top traders across all relevant categories."""
         results = {}
-        for cat in COPY_CATEGORIES:
+        for cat in categories or COPY_CATEGORIES:
             entries = self.get_leaderboard(
                 category=cat,
                 time_period=time_period,
@@ -164,40 +328,8 @@ class PolymarketDataAPI:
         limit: int = 50,
     ) -> List[TradeActivity]:
         """Get recent activity for a wallet."""
-        params: Dict[str, Any] = {
-            "user": user,
-            "type": trade_type,
-            "limit": limit,
-            "sortBy": "TIMESTAMP",
-            "sortDirection": "DESC",
-        }
-        if side:
-            params["side"] = side
-        if start:
-            params["start"] = start
-
-        data = self._get("/activity", params)
-
-        activities = []
-        for item in data:
-            activities.append(TradeActivity(
-                wallet=item.get("proxyWallet", ""),
-                timestamp=int(item.get("timestamp", 0)),
-                condition_id=item.get("conditionId", ""),
-                trade_type=item.get("type", ""),
-                side=item.get("side", ""),
-                size=float(item.get("size", 0)),
-                usdc_size=float(item.get("usdcSize", 0)),
-                price=float(item.get("price", 0)),
-                asset=item.get("asset", ""),
-                outcome=item.get("outcome", ""),
-                outcome_index=int(item.get("outcomeIndex", 0)),
-                title=item.get("title", ""),
-                slug=item.get("slug", ""),
-                event_slug=item.get("eventSlug", ""),
-                tx_hash=item.get("transactionHash", ""),
-            ))
-        return activities
+        data = self._get("/activity", _activity_params(user, trade_type, side, start, limit))
+        return _parse_activity(data)
 
     def get_buys(
         self,
@@ -214,6 +346,145 @@ class PolymarketDataAPI:
             limit=limit,
         )
 
+    # ------------------------------------------------------------------
+    # Async (pooled) access
+    # ------------------------------------------------------------------
+
+    async def open_session(self, concurrency: int = 32, http2: bool = False) -> None:
+        """
+        Open a pooled aiohttp session for the `_async` methods.
+
+        Connections are kept alive and DNS is cached, so a poll that fans
+        out to dozens of wallets costs roughly one round trip. Without
+        aiohttp the `_async` methods run requests in worker threads.
+
+        http2=True uses an httpx.AsyncClient instead, so concurrent reads
+        share streams on one TLS connection (needs `pip install httpx[http2]`;
+        falls back to aiohttp if missing).
+        """
+        if self._session is not None:
+            return
+        if http2:
+            try:
+                import h2  # noqa: F401  (httpx needs it for http2=True)
+                import httpx
+            except ImportError:
+                logger.warning("httpx[http2] not installed — using aiohttp (HTTP/1.1)")
+            else:
+                self._session = httpx.AsyncClient(
+                    http2=True,
+                    timeout=self.timeout,
+                    limits=httpx.Limits(
+                        max_connections=concurrency,
+                        max_keepalive_connections=concurrency,
+                    ),
+                )
+                self._http2 = True
+                return
+        try:
+            import aiohttp
+        except ImportError:
+            logger.warning("aiohttp not installed — async Data API calls fall back to threads")
+            return
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+
+    async def close_session(self) -> None:
+        """Close the pooled session opened by open_session()."""
+        if self._session is not None:
+            if self._http2:
+                await self._session.aclose()
+            else:
+                await self._session.close()
+            self._session = None
+            self._http2 = False
+
+    async def _get_async(self, path: str, params: dict) -> Any:
+        """Async GET over the pooled session; same error contract as _get()."""
+        if self._session is None:
+            async with self._inflight:
+                return await asyncio.to_thread(self._get, path, params)
+        key = self._cache_key(path, params)
+        if key is not None:
+            # Memory hits stay on the loop; only a disk read goes to a thread
+            cached = self._cache.peek(key)
+            if cached is None:
+                cached = await asyncio.to_thread(self._cache.get, key)
+            if cached is not None:
+                return cached
+        url = ENDPOINT_URLS.get(path) or f"{DATA_API}{path}"
+        try:
+            async with self._inflight:
+                if self._http2:
+                    resp = await self._session.get(url, params=params)
+                    status, body = resp.status_code, resp.content
+                else:
+                    async with self._session.get(url, params=params) as resp:
+                        status, body = resp.status, await resp.read()
+            if status != 200:
+                text = body[:200].decode("utf-8", "replace")
+                logger.warning(f"API {path} returned {status}: {text}")
+                return []
+            data = orjson.loads(body)
+        except Exception as e:
+            logger.error(f"API error {path}: {e}")
+            return []
+        if key is not None:
+            await asyncio.to_thread(self._cache.set, key, data, CACHE_TTLS[path])
+        return data
+
+    async def get_leaderboard_async(
+        self,
+        category: str = "OVERALL",
+        time_period: str = "WEEK",
+        order_by: str = "PNL",
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[LeaderboardEntry]:
+        """Async get_leaderboard()."""
+        data = await self._get_async("/v1/leaderboard", {
+            "category": category,
+            "timePeriod": time_period,
+            "orderBy": order_by,
+            "limit": limit,
+            "offset": offset,
+        })
+        return _parse_leaderboard(data, category, time_period)
+
+    async def get_top_traders_all_categories_async(
+        self,
+        time_period: str = "WEEK",
+        limit_per_category: int = 10,
+        categories: Optional[List[str]] = None,
+    ) -> Dict[str, List[LeaderboardEntry]]:
+        """
+        Fetch every category leaderboard concurrently.
+
+        The client's max_concurrency bounds how many are in flight, which
+        keeps the burst under the Data API rate limit that the blocking
+        version respects with its sleep between categories.
+        """
+        cats = list(categories or COPY_CATEGORIES)
+        results = await asyncio.gather(*(
+            self.get_leaderboard_async(category=cat, time_period=time_period, limit=limit_per_category)
+            for cat in cats
+        ))
+        return dict(zip(cats, results))
+
+    async def get_buys_async(
+        self,
+        user: str,
+        since_timestamp: Optional[int] = None,
+        limit: int = 20,
+    ) -> List[TradeActivity]:
+        """Async get_buys()."""
+        data = await self._get_async(
+            "/activity", _activity_params(user, "TRADE", "BUY", since_timestamp, limit)
+        )
+        return _parse_activity(data)
+
     # ------------------------------------------------------------------
     # Positions
     # ------------------------------------------------------------------
@@ -225,13 +496,7 @@ class PolymarketDataAPI:
         sort_by: str = "CURRENT",
     ) -> List[Position]:
         """Get current open positions for a wallet."""
-        data = self._get("/positions", {
-            "user": user,
-            "limit": limit,
-            "sortBy": sort_by,
-            "sortDirection": "DESC",
-            "sizeThreshold": 1,
-        })
+        data = self._get("/positions", _positions_params(user, limit, sort_by))
 
         positions = []
         for item in data:
@@ -239,14 +504,14 @@ class PolymarketDataAPI:
                 wallet=item.get("proxyWallet", ""),
                 asset=item.get("asset", ""),
                 condition_id=item.get("conditionId", ""),
-                size=float(item.get("size", 0)),
-                avg_price=float(item.get("avgPrice", 0)),
-                initial_value=float(item.get("initialValue", 0)),
-                current_value=float(item.get("currentValue", 0)),
-                cash_pnl=float(item.get("cashPnl", 0)),
-                percent_pnl=float(item.get("percentPnl", 0)),
-                realized_pnl=float(item.get("realizedPnl", 0)),
-                cur_price=float(item.get("curPrice", 0)),
+                size=_num(item.get("size")),
+                avg_price=_num(item.get("avgPrice")),
+                initial_value=_num(item.get("initialValue")),
+                current_value=_num(item.get("currentValue")),
+                cash_pnl=_num(item.get("cashPnl")),
+                percent_pnl=_num(item.get("percentPnl")),
+                realized_pnl=_num(item.get("realizedPnl")),
+                cur_price=_num(item.get("curPrice")),
                 title=item.get("title", ""),
                 slug=item.get("slug", ""),
                 event_slug=item.get("eventSlug", ""),
@@ -256,3 +521,33 @@ class PolymarketDataAPI:
                 redeemable=bool(item.get("redeemable", False)),
             ))
         return positions
+
+    def get_positions_columns(
+        self,
+        user: str,
+        limit: int = 100,
+        sort_by: str = "CURRENT",
+    ) -> Dict[str, np.ndarray]:
+        """
+        Open positions as columns (structure-of-arrays) instead of objects.
+
+        Keys are the Position attribute names. Numeric columns are float64
+        (outcome_index int64, redeemable bool), text columns are object
+        arrays, so e.g. `cols["cash_pnl"][cols["redeemable"]].sum()` is
+        vectorized.
+        """
+        data = self._get("/positions", _positions_params(user, limit, sort_by))
+        n = len(data)
+        cols: Dict[str, np.ndarray] = {
+            name: np.fromiter((_num(item.get(key)) for item in data), dtype=np.float64, count=n)
+            for name, key in POSITION_FLOAT_COLUMNS.items()
+        }
+        for name, key in POSITION_TEXT_COLUMNS.items():
+            cols[name] = np.array([item.get(key, "") for item in data], dtype=object)
+        cols["outcome_index"] = np.fromiter(
+            (int(item.get("outcomeIndex", 0)) for item in data), dtype=np.int64, count=n
+        )
+        cols["redeemable"] = np.fromiter(
+            (bool(item.get("redeemable", False)) for item in data), dtype=bool, count=n
+        )
+        return cols
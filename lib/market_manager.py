@@ -154,6 +154,8 @@ class MarketManager:
         auto_switch_market: bool = True,
         timeframe: str = "15m",
         ws_msg_skip_rate: int = 10,
+        heartbeat_interval: float = 25.0,
+        heartbeat_timeout: float = 10.0,
     ):
         """
         Initialize market manager.
@@ -164,12 +166,16 @@ class MarketManager:
             auto_switch_market: Auto switch when market changes
             timeframe: Market timeframe ("5m", "15m", "4h", "1h", "daily")
             ws_msg_skip_rate: WS message processing rate (1=all, 10=default)
+            heartbeat_interval: Seconds between app-level WS heartbeats (0=off)
+            heartbeat_timeout: Seconds to wait for heartbeat reply before reconnecting
         """
         self.coin = coin.upper()
         self.market_check_interval = market_check_interval
         self.auto_switch_market = auto_switch_market
         self.timeframe = timeframe
         self.ws_msg_skip_rate = ws_msg_skip_rate
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
 
         # Clients
         self.gamma = GammaClient()
@@ -346,7 +352,11 @@ class MarketManager:
         if not self.current_market:
             return False
 
-        self.ws = MarketWebSocket(msg_skip_rate=self.ws_msg_skip_rate)
+        self.ws = MarketWebSocket(
+            msg_skip_rate=self.ws_msg_skip_rate,
+            heartbeat_interval=self.heartbeat_interval,
+            heartbeat_timeout=self.heartbeat_timeout,
+        )
 
         @self.ws.on_book
         async def handle_book(snapshot: OrderbookSnapshot):  # pyright: ignore[reportUnusedFunction]
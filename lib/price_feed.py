@@ -2,41 +2,147 @@
 BTC Spot Price Feed - Cached price fetcher for trade logging.
 
 Fetches BTC/USDT spot price from Binance public API.
-Caches for 60 seconds to avoid excessive API calls.
-Never blocks or crashes the trading loop — returns 0.0 on failure.
+A background thread refreshes the cache every cache_seconds / 2, so
+get_price() is a plain read; it only waits on the network once, on a
+cold cache, and returns 0.0 once the cache is older than 2 * cache_seconds.
+Optionally (start_stream) prices are pushed from the Binance WebSocket
+and the REST poll only runs while the stream is down or stale.
+Never blocks or crashes the trading loop — returns 0.0 on failure, and
+after 3 consecutive failures stops calling Binance for 30 seconds.
 """
 
+import threading
 import time
+from typing import Optional
+
 import requests
 
+from src.http import CircuitBreaker, ThreadLocalSessionMixin, pooled_session
+
 
-class PriceFeed:
-    """Cached BTC spot price fetcher."""
+class PriceFeed(ThreadLocalSessionMixin):
+    """Cached BTC spot price fetcher (keep-alive session per thread)."""
 
     BINANCE_URL = "https://api.binance.com/api/v3/ticker/price"
+    # Max age (seconds) of a stream price before falling back to REST
+    STREAM_MAX_AGE = 10.0
+    # A background-refreshed price older than this many cache_seconds is
+    # treated as unavailable (REST has been failing)
+    STALE_FACTOR = 2.0
 
-    def __init__(self, symbol: str = "BTCUSDT", cache_seconds: float = 60.0):
+    def __init__(
+        self,
+        symbol: str = "BTCUSDT",
+        cache_seconds: float = 60.0,
+        background: bool = True,
+    ):
+        """
+        Args:
+            symbol: Binance symbol (e.g. "BTCUSDT")
+            cache_seconds: Max age of the cached price
+            background: Refresh from a daemon thread (stale-while-revalidate);
+                False fetches inline on a cache miss
+        """
+        super().__init__()
         self.symbol = symbol
         self.cache_seconds = cache_seconds
         self._cached_price: float = 0.0
         self._cached_at: float = 0.0
+        self._breaker = CircuitBreaker(max_failures=3, cooldown=30.0)
+
+        # Optional push feed (BinancePriceFeed), see start_stream()
+        self._stream = None
+        self._stream_coin = symbol[:-4] if symbol.endswith("USDT") else symbol
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._thread = threading.Thread(
+                target=self._refresh_loop, name=f"price-feed-{symbol}", daemon=True
+            )
+            self._thread.start()
+
+    def _new_session(self) -> requests.Session:
+        return pooled_session()
 
     def get_price(self) -> float:
-        """Get current BTC spot price (cached)."""
+        """Get current BTC spot price (live stream, else cached REST)."""
+        live = self._stream_price()
+        if live > 0:
+            return live
+
         now = time.time()
+        if self._thread is not None:
+            if self._cached_at == 0.0:
+                self._refresh()  # cold cache: first poll hasn't landed yet
+            elif now - self._cached_at > self.STALE_FACTOR * self.cache_seconds:
+                return 0.0
+            return self._cached_price
+
         if now - self._cached_at < self.cache_seconds and self._cached_price > 0:
             return self._cached_price
+        self._refresh()
+        return self._cached_price
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background refresher and wait for it to exit."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    async def start_stream(self) -> bool:
+        """
+        Take prices from the Binance WebSocket (bookTicker mid / aggTrade).
+
+        Reconnects are handled by the stream; while it is down the REST
+        cache is used. Returns False if the symbol has no stream.
+        """
+        if self._stream is not None:
+            return True
+        from lib.binance_ws import BinancePriceFeed
+        try:
+            stream = BinancePriceFeed(coins=[self._stream_coin])
+        except ValueError:
+            return False
+        self._stream = stream
+        await stream.start()
+        return True
+
+    async def stop_stream(self) -> None:
+        """Close the WebSocket stream started by start_stream()."""
+        if self._stream is not None:
+            await self._stream.stop()
+            self._stream = None
+
+    def _stream_price(self) -> float:
+        """Latest stream price, or 0.0 if not streaming or stale."""
+        stream = self._stream
+        if stream is None or stream.get_age(self._stream_coin) > self.STREAM_MAX_AGE:
+            return 0.0
+        return stream.get_price(self._stream_coin)
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.is_set():
+            # Only poll REST while the push stream isn't delivering
+            if not self._stream_price():
+                self._refresh()
+            self._stop.wait(self.cache_seconds / 2)
+
+    def _refresh(self) -> None:
+        """Fetch the price into the cache; keeps the stale value on failure."""
+        if not self._breaker.allow():
+            return
 
         try:
-            resp = requests.get(
+            resp = self.session.get(
                 self.BINANCE_URL,
                 params={"symbol": self.symbol},
-                timeout=5,
+                timeout=2,
             )
             resp.raise_for_status()
             self._cached_price = float(resp.json()["price"])
-            self._cached_at = now
+            self._cached_at = time.time()
+            self._breaker.record_success()
         except Exception:
-            pass  # Return stale cache or 0.0
-
-        return self._cached_price
+            self._breaker.record_failure()  # Return stale cache or 0.0
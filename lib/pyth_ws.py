@@ -20,7 +20,7 @@ import math
 import time
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Deque, Dict, Optional
+from typing import Deque, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -42,18 +42,12 @@ ID_TO_COIN = {v: k for k, v in PYTH_IDS.items()}
 SECONDS_PER_YEAR = 365.25 * 24 * 3600
 
 
-@dataclass
-class PricePoint:
-    price: float
-    timestamp: float
-
-
 @dataclass
 class CoinState:
     pyth_id: str
     price: float = 0.0
     last_update: float = 0.0
-    history: Deque[PricePoint] = field(default_factory=lambda: deque(maxlen=600))
+    history: Deque[Tuple[float, float]] = field(default_factory=lambda: deque(maxlen=600))
     _cached_vol: float = 0.50
     _vol_calc_time: float = 0.0
 
@@ -124,11 +118,11 @@ class PythPriceFeed:
             return 0.0
         cutoff = time.time() - lookback_seconds
         past = None
-        for p in state.history:
-            if p.timestamp <= cutoff:
-                past = p.price
+        for p, ts in state.history:
+            if ts <= cutoff:
+                past = p
         if past is None and state.history:
-            past = state.history[0].price
+            past = state.history[0][0]
         if not past or past <= 0:
             return 0.0
         return (current - past) / past
@@ -140,10 +134,12 @@ class PythPriceFeed:
             return 0.50
         returns = []
         for i in range(1, len(points)):
-            if points[i - 1].price > 0 and points[i].price > 0:
-                dt = points[i].timestamp - points[i - 1].timestamp
+            p0, t0 = points[i - 1]
+            p1, t1 = points[i]
+            if p0 > 0 and p1 > 0:
+                dt = t1 - t0
                 if dt > 0:
-                    log_ret = math.log(points[i].price / points[i - 1].price)
+                    log_ret = math.log(p1 / p0)
                     returns.append((log_ret, dt))
         if len(returns) < 5:
             return 0.50
@@ -246,7 +242,7 @@ class PythPriceFeed:
             now = time.time()
             state.last_update = now
             if now - self._last_sample.get(coin, 0) >= self.vol_sample_interval:
-                state.history.append(PricePoint(price=price, timestamp=now))
+                state.history.append((price, now))
                 self._last_sample[coin] = now
             for cb in self._price_callbacks:
                 try:
@@ -0,0 +1,198 @@
+"""
+Runtime - Event Loop Setup for App Runners
+
+Installs a libuv-backed event loop (uvloop, or winloop on Windows) in place
+of asyncio's default selector loop. Socket readiness, timers and future
+resolution then run in C, which cuts per-callback overhead on every WS
+message and settlement poll.
+
+Falls back silently to the stock asyncio loop when neither is installed.
+
+Also provides a minimal .env loader so runners don't pay for importing
+python-dotenv on every (supervisor-restarted) cold start; files using
+syntax beyond it are handed to python-dotenv.
+
+Usage:
+    from lib.runtime import install_fast_loop, load_env_file
+
+    load_env_file()                   # .env at the project root
+    loop_name = install_fast_loop()   # before run_main(...)
+    run_main(strategy.run(), on_shutdown=strategy.request_stop)
+"""
+
+import asyncio
+import os
+import re
+import signal
+import sys
+from pathlib import Path
+from typing import Any, Callable, Coroutine, Dict, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+DEFAULT_ENV_FILE = Path(__file__).resolve().parent.parent / ".env"
+
+_INLINE_COMMENT = re.compile(r"\s+#")
+
+# Syntax the inline parser leaves to python-dotenv: backslash escapes and
+# ${VAR} references
+_DOTENV_ONLY = ("\\", "${")
+
+
+def load_env_file(path: Optional[Union[str, Path]] = None) -> int:
+    """
+    Load KEY=VALUE pairs from a .env file into os.environ.
+
+    The common case is parsed inline, without importing python-dotenv:
+    blank lines, `#` comments (inline ones need whitespace before the
+    `#`), an optional `export ` prefix and single/double-quoted values
+    (text after the closing quote is ignored). A file using syntax this
+    parser doesn't handle - backslash escapes, `${VAR}` references or a
+    quote left open (multi-line value) - is loaded with python-dotenv
+    instead, so values never differ from load_dotenv().
+
+    Variables already set in the environment are never overridden (same
+    as load_dotenv's default).
+
+    Args:
+        path: File to read (default: .env at the project root)
+
+    Returns:
+        Number of variables set; 0 if the file does not exist
+    """
+    env_path = Path(path) if path is not None else DEFAULT_ENV_FILE
+    try:
+        with open(env_path, encoding="utf-8") as f:
+            text = f.read()
+    except FileNotFoundError:
+        return 0
+
+    values = None if any(t in text for t in _DOTENV_ONLY) else _parse_env_text(text)
+    if values is None:
+        from dotenv import dotenv_values
+        values = dotenv_values(env_path)
+
+    loaded = 0
+    for key, value in values.items():
+        if value is not None and key not in os.environ:
+            os.environ[key] = value
+            loaded += 1
+    return loaded
+
+
+def _parse_env_text(text: str) -> Optional[Dict[str, str]]:
+    """Parse simple .env text; None if it needs python-dotenv."""
+    values: Dict[str, str] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[7:]
+        key, sep, raw = line.partition("=")
+        key = key.strip()
+        if not sep or not key:
+            continue
+
+        raw = raw.strip()
+        quote = raw[:1]
+        if quote in ("'", '"'):
+            end = raw.find(quote, 1)
+            if end < 0:
+                return None  # multi-line or malformed quoting
+            values[key] = raw[1:end]
+        else:
+            values[key] = _INLINE_COMMENT.split(raw, 1)[0].rstrip()
+    return values
+
+
+def install_fast_loop() -> str:
+    """
+    Install the fastest available event loop policy.
+
+    Must be called BEFORE any asyncio context is created so the main
+    loop picks it up.
+
+    Returns:
+        Name of the active loop: "uvloop", "winloop" or "asyncio"
+    """
+    if sys.platform == "win32":
+        try:
+            import winloop
+        except ImportError:
+            return "asyncio"
+        asyncio.set_event_loop_policy(winloop.EventLoopPolicy())
+        return "winloop"
+
+    try:
+        import uvloop
+    except ImportError:
+        return "asyncio"
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return "uvloop"
+
+
+SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+def install_shutdown_handlers(on_shutdown: Callable[[], None]) -> bool:
+    """
+    Route SIGINT/SIGTERM to a cooperative stop callback on the running loop.
+
+    The first signal calls `on_shutdown` (e.g. strategy.request_stop) so the
+    strategy leaves its main loop and runs its own cleanup - cancelling open
+    orders, stopping feeds, flushing logs - instead of having every task
+    cancelled mid-I/O. The handlers are then removed, so a second Ctrl+C
+    falls back to the default KeyboardInterrupt.
+
+    Must be called from inside the running loop.
+
+    Returns:
+        False if the platform has no loop signal support (Windows)
+    """
+    loop = asyncio.get_running_loop()
+
+    def _fire() -> None:
+        for sig in SHUTDOWN_SIGNALS:
+            loop.remove_signal_handler(sig)
+        on_shutdown()
+
+    try:
+        for sig in SHUTDOWN_SIGNALS:
+            loop.add_signal_handler(sig, _fire)
+    except (NotImplementedError, RuntimeError):
+        return False
+    return True
+
+
+def run_main(
+    coro: Coroutine[Any, Any, T],
+    on_shutdown: Optional[Callable[[], None]] = None,
+) -> T:
+    """
+    Run the app's top-level coroutine with asyncio debug mode forced off.
+
+    asyncio.run() enables debug mode when PYTHONASYNCIODEBUG or -X dev is
+    set, which timestamps every callback for slow-callback warnings and
+    records creation tracebacks for every task/handle. A stray env var on
+    the VPS must not silently slow the WS hot path, so pin it off here.
+
+    Args:
+        coro: Top-level coroutine (usually strategy.run())
+        on_shutdown: Optional stop callback for SIGINT/SIGTERM, see
+            install_shutdown_handlers()
+    """
+    if on_shutdown is not None:
+        main_coro = coro
+
+        async def _with_handlers() -> T:
+            install_shutdown_handlers(on_shutdown)
+            return await main_coro
+
+        coro = _with_handlers()
+
+    runner_cls = getattr(asyncio, "Runner", None)
+    if runner_cls is None:  # Python < 3.11
+        return asyncio.run(coro, debug=False)
+    with runner_cls(debug=False) as runner:
+        return runner.run(coro)
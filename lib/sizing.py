@@ -0,0 +1,70 @@
+"""
+Sizing - Kelly Math for Binary Markets
+
+Single source for the binary-payoff sizing formulas used by the runner
+banners and the strategies' per-signal sizing:
+- Full Kelly fraction for buying a $1 binary at a given price
+- Fractional-Kelly bet in USDC with an optional cap
+- Breakeven win rate and payout multiple for an entry price
+
+Binary payoff: pay `price`, receive $1 on win, $0 on loss, so net odds
+b = 1/price - 1 and Kelly f = (p*b - q)/b = (p - price)/(1 - price).
+
+Usage:
+    from lib.sizing import kelly_fraction, sizing_preview
+
+    f = kelly_fraction(p=0.55, price=0.40)          # 0.25
+    preview = sizing_preview(0.55, 0.40, bankroll=50.0, frac=0.25)
+    print(f"{preview.payout_mult:.1f}x, bet ${preview.bet:.2f}")
+"""
+
+import math
+from typing import NamedTuple, Tuple
+
+
+class SizingPreview(NamedTuple):
+    """Displayed sizing quantities for a sample entry."""
+    kelly_f: float        # full Kelly fraction
+    bet: float            # fractional-Kelly bet in USDC
+    breakeven_wr: float   # win rate needed to break even (0-1)
+    payout_mult: float    # $ returned per $ staked on a win
+
+
+def kelly_fraction(p: float, price: float) -> float:
+    """
+    Full Kelly fraction for buying a binary at `price` with win probability `p`.
+
+    Returns 0.0 when there is no edge or the price is outside (0, 1).
+    """
+    if price <= 0.0 or price >= 1.0 or p <= price:
+        return 0.0
+    return (p - price) / (1.0 - price)
+
+
+def kelly_bet(
+    p: float,
+    price: float,
+    bankroll: float,
+    frac: float,
+    cap_usdc: float = math.inf,
+) -> float:
+    """Fractional-Kelly bet in USDC, capped at `cap_usdc` (0.0 if no edge)."""
+    return min(kelly_fraction(p, price) * frac * bankroll, cap_usdc)
+
+
+def breakeven_and_payout(entry: float) -> Tuple[float, float]:
+    """Breakeven win rate (0-1) and payout multiple for a binary entry price."""
+    if entry <= 0.0:
+        return 0.0, 0.0
+    return entry, 1.0 / entry
+
+
+def sizing_preview(p: float, price: float, bankroll: float, frac: float) -> SizingPreview:
+    """All banner sizing numbers for one sample entry in a single call."""
+    breakeven_wr, payout_mult = breakeven_and_payout(price)
+    return SizingPreview(
+        kelly_f=kelly_fraction(p, price),
+        bet=kelly_bet(p, price, bankroll, frac),
+        breakeven_wr=breakeven_wr,
+        payout_mult=payout_mult,
+    )
@@ -6,9 +6,15 @@ Tracks performance by entry price bucket to find optimal parameters.
 
 Key design:
     - CSV only contains RESOLVED trades (won/lost) — no duplicate pending rows
-    - Pending trades are saved to a JSON sidecar file that survives restarts
+    - Pending trades are kept in an append-only JSONL journal that survives
+      restarts (one small write per trade/resolution; compacted on startup)
     - Trade key is slug:side to support both sides in the same market
     - Real USDC balance is logged alongside each trade for reconciliation
+    - Resolved rows are buffered and appended in batches; until a batch hits
+      disk its records stay in the pending sidecar, so a crash loses nothing
+    - log_format="msgpack" / "arrow" append binary rows (.mpk / .arrow next
+      to the CSV path) instead of CSV text; scripts/trades_to_csv.py converts
+      them back for CSV consumers
 
 Usage:
     from lib.trade_logger import TradeLogger
@@ -27,18 +33,76 @@ Usage:
     logger.log_outcome("btc-updown-5m-123456", side="down", won=True, payout=5.0)
 """
 
+import atexit
 import csv
-import json
+import functools
+import io
+import itertools
 import logging
+import operator
 import os
+import struct
+import threading
 import time
-from dataclasses import dataclass, field, asdict
-from datetime import datetime, timezone
+import warnings
+import weakref
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Any, Optional, Dict, Iterator, List, Tuple
+
+import numpy as np
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# On-disk formats for resolved trades. csv is the default; the binary
+# formats skip per-field stringifying/quoting on the settlement path.
+LOG_FORMATS = ("csv", "msgpack", "arrow")
+LOG_SUFFIXES = {"csv": ".csv", "msgpack": ".mpk", "arrow": ".arrow"}
+
+# Pending-trade journal (.pending.jsonl), one op per line, replayed on load:
+#   {"op": "add", "key": trade_key, "rec": {...TradeRecord fields}}
+#   {"op": "del", "key": trade_key}   (resolved row is on disk)
+# It is rewritten with only the live adds on startup, and at runtime once
+# it holds more than _JOURNAL_COMPACT_RATIO ops per live trade.
+_JOURNAL_COMPACT_RATIO = 4
+_JOURNAL_COMPACT_MIN = 256
+
+# msgpack rows are length-prefixed so the file can be read back record by
+# record (ormsgpack has no streaming unpacker)
+_MPK_LEN = struct.Struct("<I")
+
+# Rows per chunk when reading a trade log column-wise (bounds memory on
+# warm-start from a long history)
+COLUMN_CHUNK_ROWS = 100_000
+
+# Entry prices are in [0, 1], so per-cent buckets index a fixed array
+PRICE_BUCKETS = 101
+
+
+def price_bucket(price: float) -> int:
+    """Entry-price bucket (nearest cent, clamped to 0..100)."""
+    return min(max(round(price * 100), 0), PRICE_BUCKETS - 1)
+
+
+# (unix second, "YYYY-MM-DDTHH:MM:SS") for the last second formatted
+_ts_second: Tuple[int, str] = (-1, "")
+
+
+def utc_timestamp() -> str:
+    """
+    Current UTC time as ISO 8601 with microseconds and +00:00 offset.
+
+    Same text as datetime.now(timezone.utc).isoformat() (microseconds
+    always included); the date/time part is formatted once per second.
+    """
+    global _ts_second
+    sec, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached = _ts_second
+    if cached[0] != sec:
+        cached = _ts_second = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)))
+    return f"{cached[1]}.{micros:06d}+00:00"
+
 
 @dataclass
 class TradeRecord:
@@ -88,9 +152,9 @@ class SessionStats:
     total_payout: float = 0.0
     total_pnl: float = 0.0
 
-    # Per entry-price bucket stats (rounded to nearest cent)
-    bucket_trades: Dict[int, int] = field(default_factory=dict)  # price_cents -> count
-    bucket_wins: Dict[int, int] = field(default_factory=dict)  # price_cents -> wins
+    # Per entry-price bucket stats, indexed by price in cents (0-100)
+    bucket_trades: np.ndarray = field(default_factory=lambda: np.zeros(PRICE_BUCKETS, np.int64))
+    bucket_wins: np.ndarray = field(default_factory=lambda: np.zeros(PRICE_BUCKETS, np.int64))
 
     @property
     def win_rate(self) -> float:
@@ -105,10 +169,17 @@ class SessionStats:
 
     def bucket_win_rate(self, price_cents: int) -> float:
         """Win rate for a specific entry price bucket."""
-        trades = self.bucket_trades.get(price_cents, 0)
-        wins = self.bucket_wins.get(price_cents, 0)
+        trades = int(self.bucket_trades[price_cents])
+        wins = int(self.bucket_wins[price_cents])
         return (wins / trades * 100) if trades > 0 else 0.0
 
+    def active_buckets(self) -> List[Tuple[int, int, int]]:
+        """(price_cents, trades, wins) for each bucket that has trades."""
+        return [
+            (int(cents), int(self.bucket_trades[cents]), int(self.bucket_wins[cents]))
+            for cents in np.flatnonzero(self.bucket_trades)
+        ]
+
     def get_summary(self) -> str:
         """Get formatted summary string."""
         decided = self.wins + self.losses
@@ -121,12 +192,11 @@ class SessionStats:
         ]
 
         # Per-bucket breakdown
-        if self.bucket_trades:
+        buckets = self.active_buckets()
+        if buckets:
             lines.append("--- By Entry Price ---")
-            for cents in sorted(self.bucket_trades.keys()):
-                trades = self.bucket_trades[cents]
-                wins = self.bucket_wins.get(cents, 0)
-                wr = self.bucket_win_rate(cents)
+            for cents, trades, wins in buckets:
+                wr = wins / trades * 100
                 lines.append(f"  ${cents/100:.2f}: {trades} trades, {wr:.0f}% win rate ({wins}/{trades})")
 
         return "\n".join(lines)
@@ -137,8 +207,17 @@ class TradeLogger:
     CSV-based trade logger with analytics.
 
     - CSV only contains RESOLVED trades (won/lost) — no duplicates
-    - Pending trades persist in a JSON sidecar file across restarts
+    - Pending trades persist in a JSONL journal across restarts
     - Trade key is slug:side to support both sides in same market
+    - Resolved rows are buffered: flushed every buffer_rows rows, or once the
+      oldest has waited flush_interval seconds (checked on each resolve and
+      by flush_if_due(), which the strategy loops call every tick), and
+      always on flush()/exit
+    - The trade log and journal stay open for appending; close() flushes
+      and releases them. An atexit hook (holding the logger weakly) closes
+      any logger still open at exit; close() unregisters it
+    - Both are fsynced in batches (every fsync_rows resolved rows or
+      fsync_interval seconds) and on close(), not on every write
     """
 
     CSV_HEADERS = [
@@ -152,17 +231,80 @@ class TradeLogger:
         "vol_source", "strike_source",
     ]
 
-    def __init__(self, filepath: str = "data/trades.csv"):
+    # Text columns; everything else is a float
+    STR_COLUMNS = frozenset((
+        "timestamp", "market_slug", "coin", "timeframe", "side",
+        "outcome", "vol_source", "strike_source",
+    ))
+
+    # Per-column CSV number format, aligned with CSV_HEADERS (None = as-is)
+    CSV_FORMATS = (
+        None, None, None, None, None,
+        ".4f", ".2f", ".2f",
+        None, ".2f", ".2f", ".2f", ".2f",
+        ".2f", ".4f", ".6f",
+        ".0f",
+        ".8f", ".6f",
+        ".0f", ".0f", ".0f",
+        None, None,
+    )
+
+    # One str.format template for a whole CSV row, built from CSV_FORMATS
+    CSV_ROW_TEMPLATE = ",".join(
+        "{}" if fmt is None else "{:" + fmt + "}" for fmt in CSV_FORMATS
+    ) + "\r\n"
+
+    _row_values = operator.attrgetter(*CSV_HEADERS)
+
+    def __init__(
+        self,
+        filepath: str = "data/trades.csv",
+        buffer_rows: int = 32,
+        flush_interval: float = 5.0,
+        log_format: str = "csv",
+        fsync_rows: int = 10,
+        fsync_interval: float = 5.0,
+    ):
+        if log_format not in LOG_FORMATS:
+            raise ValueError(f"log_format must be one of {LOG_FORMATS}, got {log_format!r}")
+        self.log_format = log_format
+        self._codec = _load_codec(log_format)
+
         self.filepath = Path(filepath)
-        self.pending_filepath = self.filepath.with_suffix(".pending.json")
+        # Resolved rows go to a format-specific file next to the CSV path;
+        # the pending sidecar is shared so switching formats keeps open trades
+        self.data_filepath = self.filepath.with_suffix(LOG_SUFFIXES[log_format])
+        self.pending_filepath = self.filepath.with_suffix(".pending.jsonl")
         self.stats = SessionStats()
         self._pending_trades: Dict[str, TradeRecord] = {}  # trade_key -> record
+        # market_slug -> {trade_key: record}, mirrors _pending_trades
+        self._pending_by_slug: Dict[str, Dict[str, TradeRecord]] = {}
+        self._pending_fp: Optional[Any] = None  # journal append handle
+        self._data_fp: Optional[Any] = None  # trade log append handle
+        self._journal_ops = 0  # lines in the journal since last compaction
+        # Exit hook holding only a weakref, see _register_atexit()
+        self._atexit_hook = functools.partial(_close_at_exit, weakref.ref(self))
+        self._atexit_registered = False
+
+        # Write buffer for resolved rows (log_trade may be called from threads)
+        self.buffer_rows = max(1, buffer_rows)
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._rows: List[tuple] = []  # column values, in CSV_HEADERS order
+        self._unflushed: Dict[str, TradeRecord] = {}  # resolved, not yet on disk
+        self._buffered_since = 0.0  # monotonic time the oldest buffered row arrived
+
+        # Batched durability: rows written since the last fsync
+        self.fsync_rows = max(1, fsync_rows)
+        self.fsync_interval = fsync_interval
+        self._rows_since_sync = 0
+        self._last_sync = time.monotonic()
 
         # Create data directory if needed
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
 
         # Write headers if file doesn't exist
-        if not self.filepath.exists():
+        if log_format == "csv" and not self.filepath.exists():
             with open(self.filepath, "w", newline="") as f:
                 writer = csv.writer(f)
                 writer.writerow(self.CSV_HEADERS)
@@ -170,70 +312,146 @@ class TradeLogger:
         # Load stats from existing resolved trades
         self._load_existing_stats()
 
-        # Load pending trades from JSON sidecar (survives restarts)
+        # Load pending trades from the journal (survives restarts)
         self._load_pending()
 
+        self._register_atexit()
+
     def _load_existing_stats(self) -> None:
-        """Load stats from existing CSV file (only resolved trades)."""
-        if not self.filepath.exists():
+        """Load stats from the existing trade log (only resolved trades).
+
+        The log is folded in chunk by chunk. Unparseable rows are skipped
+        (see iter_trade_columns); if reading stops part-way, the rows
+        folded so far are kept.
+        """
+        if not self.data_filepath.exists():
             return
 
         try:
-            with open(self.filepath, "r") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    outcome = row.get("outcome", "pending")
-                    if outcome == "pending":
-                        continue  # Skip any legacy pending rows
-
-                    entry_price = float(row.get("entry_price", 0))
-                    bet_size = float(row.get("bet_size_usdc", 0))
-                    payout = float(row.get("payout", 0))
-                    pnl = float(row.get("pnl", 0))
-                    price_bucket = round(entry_price * 100)
-
-                    self.stats.total_trades += 1
-                    self.stats.total_wagered += bet_size
-                    self.stats.bucket_trades[price_bucket] = self.stats.bucket_trades.get(price_bucket, 0) + 1
-
-                    if outcome == "won":
-                        self.stats.wins += 1
-                        self.stats.total_payout += payout
-                        self.stats.total_pnl += pnl
-                        self.stats.bucket_wins[price_bucket] = self.stats.bucket_wins.get(price_bucket, 0) + 1
-                    elif outcome == "lost":
-                        self.stats.losses += 1
-                        self.stats.total_pnl += pnl
-        except Exception:
-            pass
+            for cols in iter_trade_columns(
+                self.data_filepath,
+                ("outcome", "entry_price", "bet_size_usdc", "payout", "pnl"),
+            ):
+                self._add_stats_chunk(self.stats, cols)
+        except Exception as e:
+            logger.warning(
+                f"Stopped loading stats from {self.data_filepath} after "
+                f"{self.stats.total_trades} trades: {e}"
+            )
+
+    @staticmethod
+    def _add_stats_chunk(stats: SessionStats, cols: Dict[str, np.ndarray]) -> None:
+        """Fold one chunk of trade-log columns into stats."""
+        # Skip any legacy pending rows
+        done = cols["outcome"] != "pending"
+        outcome = cols["outcome"][done]
+        won = outcome == "won"
+        decided = won | (outcome == "lost")
+        pnl = cols["pnl"][done]
+        buckets = np.clip(
+            np.rint(cols["entry_price"][done] * 100), 0, PRICE_BUCKETS - 1
+        ).astype(np.int64)
+
+        stats.total_trades += int(done.sum())
+        stats.wins += int(won.sum())
+        stats.losses += int(decided.sum()) - int(won.sum())
+        stats.total_wagered += float(cols["bet_size_usdc"][done].sum())
+        stats.total_payout += float(cols["payout"][done][won].sum())
+        stats.total_pnl += float(pnl[decided].sum())
+
+        stats.bucket_trades += np.bincount(buckets, minlength=PRICE_BUCKETS)
+        stats.bucket_wins += np.bincount(buckets[won], minlength=PRICE_BUCKETS)
 
     def _load_pending(self) -> None:
-        """Load pending trades from JSON sidecar file."""
-        if not self.pending_filepath.exists():
-            return
+        """Replay the pending journal, then compact it and open it for appends.
 
+        A legacy .pending.json sidecar (one JSON object) is imported once and
+        renamed to .pending.json.migrated.
+        """
+        legacy = self.filepath.with_suffix(".pending.json")
+        migrate = not self.pending_filepath.exists() and legacy.exists()
         try:
-            with open(self.pending_filepath, "r") as f:
-                data = json.load(f)
+            if migrate:
+                with open(legacy, "rb") as f:
+                    data = orjson.loads(f.read())
+            else:
+                data = read_pending(self.pending_filepath)
 
             for key, record_dict in data.items():
-                record = TradeRecord(**record_dict)
-                self._pending_trades[key] = record
+                self._add_pending(key, TradeRecord(**record_dict))
                 self.stats.pending += 1
         except Exception as e:
             logger.error(f"Failed to load pending trades from {self.pending_filepath}: {e}")
+            # Never compact over a journal we couldn't read; append to it
+            migrate = False
+            try:
+                self._pending_fp = self._open_journal()
+            except OSError as e:
+                logger.error(f"CRITICAL: Cannot open {self.pending_filepath}: {e}")
+            return
+
+        self._compact_pending()
+        if migrate and self.pending_filepath.exists():
+            os.replace(legacy, legacy.with_name(legacy.name + ".migrated"))
+
+    def _compact_pending(self) -> None:
+        """Rewrite the journal as one add per live record (atomic rename).
 
-    def _save_pending(self) -> None:
-        """Save pending trades to JSON sidecar file."""
+        Resolved records still sitting in the write buffer count as live, so
+        they are re-resolved after a crash instead of being lost.
+        """
         try:
-            data = {}
-            for key, record in self._pending_trades.items():
-                data[key] = asdict(record)
+            live = {**self._unflushed, **self._pending_trades}
+            # orjson serializes the dataclasses natively (no asdict() copy)
+            payload = b"".join(
+                orjson.dumps({"op": "add", "key": key, "rec": record}) + b"\n"
+                for key, record in live.items()
+            )
+            tmp = self.pending_filepath.with_name(self.pending_filepath.name + ".tmp")
+            with open(tmp, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, self.pending_filepath)
+
+            if self._pending_fp is not None:
+                self._pending_fp.close()
+            self._pending_fp = self._open_journal()
+            self._journal_ops = len(live)
+        except Exception as e:
+            logger.error(f"CRITICAL: Failed to save pending trades to {self.pending_filepath}: {e}")
 
-            with open(self.pending_filepath, "w") as f:
-                json.dump(data, f, indent=2)
+    def _journal(self, *ops: Dict[str, Any]) -> None:
+        """Append ops to the pending journal (caller holds the lock)."""
+        try:
+            if self._pending_fp is None:
+                self._pending_fp = self._open_journal()
+            self._pending_fp.write(b"".join(orjson.dumps(op) + b"\n" for op in ops))
         except Exception as e:
             logger.error(f"CRITICAL: Failed to save pending trades to {self.pending_filepath}: {e}")
+            return
+
+        self._journal_ops += len(ops)
+        live = len(self._pending_trades) + len(self._unflushed)
+        if (
+            self._journal_ops > _JOURNAL_COMPACT_MIN
+            and self._journal_ops > _JOURNAL_COMPACT_RATIO * live
+        ):
+            self._compact_pending()
+
+    def _add_pending(self, trade_key: str, record: TradeRecord) -> None:
+        old = self._pending_trades.get(trade_key)
+        if old is not None:
+            self._pending_by_slug[old.market_slug].pop(trade_key, None)
+        self._pending_trades[trade_key] = record
+        self._pending_by_slug.setdefault(record.market_slug, {})[trade_key] = record
+
+    def _pop_pending(self, trade_key: str) -> Optional[TradeRecord]:
+        record = self._pending_trades.pop(trade_key, None)
+        if record is not None:
+            by_key = self._pending_by_slug[record.market_slug]
+            del by_key[trade_key]
+            if not by_key:
+                del self._pending_by_slug[record.market_slug]
+        return record
 
     def log_trade(
         self,
@@ -264,7 +482,7 @@ class TradeLogger:
         CSV entry is written when outcome is known.
         """
         record = TradeRecord(
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=utc_timestamp(),
             market_slug=market_slug,
             coin=coin,
             timeframe=timeframe,
@@ -291,16 +509,16 @@ class TradeLogger:
         trade_key = record.trade_key
 
         # Track as pending
-        self._pending_trades[trade_key] = record
-        self._save_pending()
+        with self._lock:
+            self._add_pending(trade_key, record)
+            self._journal({"op": "add", "key": trade_key, "rec": record})
 
         # Update stats
         self.stats.total_trades += 1
         self.stats.pending += 1
         self.stats.total_wagered += bet_size_usdc
 
-        price_bucket = round(entry_price * 100)
-        self.stats.bucket_trades[price_bucket] = self.stats.bucket_trades.get(price_bucket, 0) + 1
+        self.stats.bucket_trades[price_bucket(entry_price)] += 1
 
         return record
 
@@ -317,7 +535,12 @@ class TradeLogger:
         This writes the resolved entry to CSV.
         """
         trade_key = f"{market_slug}:{side}"
-        record = self._pending_trades.pop(trade_key, None)
+        with self._lock:
+            self._resolve(trade_key, won, payout, usdc_balance)
+
+    def _resolve(self, trade_key: str, won: bool, payout: float, usdc_balance: float) -> None:
+        """Move a pending trade to the write buffer (caller holds the lock)."""
+        record = self._pop_pending(trade_key)
         if not record:
             return
 
@@ -332,56 +555,181 @@ class TradeLogger:
         if won:
             self.stats.wins += 1
             self.stats.total_payout += payout
-            price_bucket = round(record.entry_price * 100)
-            self.stats.bucket_wins[price_bucket] = self.stats.bucket_wins.get(price_bucket, 0) + 1
+            self.stats.bucket_wins[price_bucket(record.entry_price)] += 1
         else:
             self.stats.losses += 1
 
         self.stats.total_pnl += record.pnl
 
-        # Write resolved entry to CSV (the ONLY time we write to CSV)
-        self._write_record(record)
+        # Queue resolved entry for the log (the ONLY time we write to it)
+        if not self._rows:
+            self._buffered_since = time.monotonic()
+        self._unflushed[trade_key] = record
+        self._rows.append(self._row_values(record))
 
-        # Update pending sidecar
-        self._save_pending()
+        if (
+            len(self._unflushed) >= self.buffer_rows
+            or time.monotonic() - self._buffered_since >= self.flush_interval
+        ):
+            self.flush()
+        # Otherwise nothing to write: the journal keeps the record live
+        # until its row is flushed
 
-    def _write_record(self, record: TradeRecord) -> None:
-        """Append a resolved record to CSV."""
-        try:
-            with open(self.filepath, "a", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    record.timestamp,
-                    record.market_slug,
-                    record.coin,
-                    record.timeframe,
-                    record.side,
-                    f"{record.entry_price:.4f}",
-                    f"{record.bet_size_usdc:.2f}",
-                    f"{record.num_tokens:.2f}",
-                    record.outcome,
-                    f"{record.payout:.2f}",
-                    f"{record.pnl:.2f}",
-                    f"{record.bankroll:.2f}",
-                    f"{record.usdc_balance:.2f}",
-                    f"{record.btc_price:.2f}",
-                    f"{record.other_side_price:.4f}",
-                    f"{record.volatility_std:.6f}",
-                    f"{record.time_to_expiry_at_entry:.0f}",
-                    f"{record.momentum_at_entry:.8f}",
-                    f"{record.volatility_at_entry:.6f}",
-                    f"{record.signal_to_order_ms:.0f}",
-                    f"{record.order_latency_ms:.0f}",
-                    f"{record.total_latency_ms:.0f}",
-                    record.vol_source,
-                    record.strike_source,
-                ])
-        except Exception as e:
-            logger.error(f"CRITICAL: Failed to write trade to CSV {self.filepath}: {e}")
+    def flush_if_due(self) -> None:
+        """Flush once the oldest buffered row has waited flush_interval seconds.
+
+        Cheap when nothing is buffered; meant to be called every loop tick.
+        """
+        if self._rows and time.monotonic() - self._buffered_since >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append all buffered rows to the trade log in a single write."""
+        with self._lock:
+            if not self._rows:
+                return
+            try:
+                self._append_rows(self._rows)
+            except Exception as e:
+                # Keep the rows buffered (and in the journal) for the next
+                # attempt, which reopens the log; flush_if_due() retries
+                # after another flush_interval rather than every tick
+                self._buffered_since = time.monotonic()
+                logger.error(f"CRITICAL: Failed to write trades to {self.data_filepath}: {e}")
+                self._close_data_file()
+                return
+
+            self._rows_since_sync += len(self._rows)
+            self._rows.clear()
+            self._journal(*({"op": "del", "key": key} for key in self._unflushed))
+            self._unflushed.clear()
+
+            if (
+                self._rows_since_sync >= self.fsync_rows
+                or time.monotonic() - self._last_sync >= self.fsync_interval
+            ):
+                self._sync()
+
+    def _sync(self) -> None:
+        """fsync the trade log and journal (caller holds the lock)."""
+        self._rows_since_sync = 0
+        self._last_sync = time.monotonic()
+        for fp in (self._data_fp, self._pending_fp):
+            if fp is None:
+                continue
+            try:
+                os.fsync(fp.fileno())
+            except (OSError, ValueError) as e:
+                logger.warning(f"fsync failed for {fp.name}: {e}")
+
+    def close(self) -> None:
+        """Flush buffered rows and close the open log/journal handles.
+
+        Safe to call more than once; a later write simply reopens them.
+        """
+        with self._lock:
+            self.flush()
+            self._sync()
+            self._close_data_file()
+            if self._pending_fp is not None:
+                self._pending_fp.close()
+                self._pending_fp = None
+            if self._atexit_registered:
+                atexit.unregister(self._atexit_hook)
+                self._atexit_registered = False
+
+    def _register_atexit(self) -> None:
+        """Close at exit (held weakly, so the hook never keeps us alive)."""
+        if not self._atexit_registered:
+            atexit.register(self._atexit_hook)
+            self._atexit_registered = True
+
+    def _open_journal(self) -> Any:
+        self._register_atexit()
+        # Unbuffered: each op reaches the OS in a single write
+        return open(self.pending_filepath, "ab", buffering=0)
+
+    def _data_file(self) -> Any:
+        """Append handle for the trade log, opened on first use and kept."""
+        if self._data_fp is None:
+            self._register_atexit()
+            if self.log_format == "csv":
+                self._data_fp = open(self.data_filepath, "a", buffering=1 << 16, newline="")
+            else:
+                self._data_fp = open(self.data_filepath, "ab", buffering=1 << 16)
+        return self._data_fp
+
+    def _close_data_file(self) -> None:
+        fp, self._data_fp = self._data_fp, None
+        if fp is not None:
+            try:
+                fp.close()
+            except OSError:
+                pass
+
+    @classmethod
+    def format_csv_row(cls, values: tuple) -> List[Any]:
+        """Render column values (CSV_HEADERS order) as CSV fields."""
+        return [
+            v if fmt is None else format(v, fmt)
+            for v, fmt in zip(values, cls.CSV_FORMATS)
+        ]
+
+    @classmethod
+    def format_csv_lines(cls, rows: List[tuple]) -> str:
+        """
+        Render rows as CSV text (csv.writer dialect, \r\n line ends).
+
+        Each row is one CSV_ROW_TEMPLATE.format() call; a row whose text
+        fields need quoting (comma, quote or newline) goes through
+        csv.writer instead.
+        """
+        template = cls.CSV_ROW_TEMPLATE
+        n_commas = len(cls.CSV_HEADERS) - 1
+        lines = []
+        for values in rows:
+            line = template.format(*values)
+            if line.count(",") != n_commas or '"' in line or line.count("\n") != 1 or line.count("\r") != 1:
+                buf = io.StringIO()
+                csv.writer(buf).writerow(cls.format_csv_row(values))
+                line = buf.getvalue()
+            lines.append(line)
+        return "".join(lines)
+
+    def _append_rows(self, rows: List[tuple]) -> None:
+        """Serialize rows in the configured format and append them to disk.
+
+        The handle is flushed before returning, so rows have reached the OS
+        by the time the journal marks them resolved.
+        """
+        f = self._data_file()
+        if self.log_format == "csv":
+            f.write(self.format_csv_lines(rows))
+
+        elif self.log_format == "msgpack":
+            buf = bytearray()
+            for v in rows:
+                payload = self._codec.packb(dict(zip(self.CSV_HEADERS, v)))
+                buf += _MPK_LEN.pack(len(payload))
+                buf += payload
+            f.write(buf)
+
+        else:  # arrow: one self-contained IPC stream per flushed batch
+            pa = self._codec
+            schema = _arrow_schema(pa)
+            columns = list(zip(*rows))
+            batch = pa.RecordBatch.from_arrays(
+                [pa.array(col, type=schema.field(i).type) for i, col in enumerate(columns)],
+                schema=schema,
+            )
+            with pa.ipc.new_stream(f, schema) as writer:
+                writer.write_batch(batch)
+
+        f.flush()
 
     def get_pending_slugs(self) -> List[str]:
         """Get list of market slugs with pending outcomes."""
-        return list(set(r.market_slug for r in self._pending_trades.values()))
+        return list(self._pending_by_slug)
 
     def get_pending_trades(self) -> Dict[str, TradeRecord]:
         """Get all pending trades (for resolving on startup)."""
@@ -389,8 +737,212 @@ class TradeLogger:
 
     def get_pending_for_market(self, market_slug: str) -> List[Tuple[str, TradeRecord]]:
         """Get pending trades for a specific market slug."""
-        results = []
-        for key, record in self._pending_trades.items():
-            if record.market_slug == market_slug:
-                results.append((record.side, record))
-        return results
+        return [(record.side, record) for record in self._pending_by_slug.get(market_slug, {}).values()]
+
+
+def _close_at_exit(ref: "weakref.ref[TradeLogger]") -> None:
+    trade_logger = ref()
+    if trade_logger is not None:
+        trade_logger.close()
+
+
+def _load_codec(log_format: str) -> Any:
+    """Import the serializer for a log format (binary formats are optional deps)."""
+    if log_format == "msgpack":
+        try:
+            import ormsgpack
+        except ImportError as e:
+            raise ImportError("log_format='msgpack' requires ormsgpack (pip install ormsgpack)") from e
+        return ormsgpack
+    if log_format == "arrow":
+        try:
+            import pyarrow
+            import pyarrow.ipc  # noqa: F401
+        except ImportError as e:
+            raise ImportError("log_format='arrow' requires pyarrow (pip install pyarrow)") from e
+        return pyarrow
+    return None
+
+
+def _arrow_schema(pa: Any) -> Any:
+    return pa.schema([
+        (name, pa.string() if name in TradeLogger.STR_COLUMNS else pa.float64())
+        for name in TradeLogger.CSV_HEADERS
+    ])
+
+
+def read_pending(path: "str | Path") -> Dict[str, Dict[str, Any]]:
+    """
+    Replay a pending-trade journal into {trade_key: TradeRecord fields}.
+
+    Lines that don't parse (e.g. a torn final write) are skipped.
+    """
+    live: Dict[str, Dict[str, Any]] = {}
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return live
+    with f:
+        for line in f:
+            try:
+                op = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            if op.get("op") == "add":
+                live[op["key"]] = op["rec"]
+            elif op.get("op") == "del":
+                live.pop(op["key"], None)
+    return live
+
+
+def _arrow_batches(path: Path) -> Iterator[Any]:
+    """Record batches of an Arrow trade log (a sequence of IPC streams)."""
+    pa = _load_codec("arrow")
+    with open(path, "rb") as f:
+        end = os.fstat(f.fileno()).st_size
+        # File is a sequence of IPC streams, one per flushed batch
+        while f.tell() < end:
+            try:
+                yield from pa.ipc.open_stream(f)
+            except pa.ArrowInvalid:
+                break  # torn tail from an interrupted write
+
+
+def iter_trade_columns(
+    path: "str | Path",
+    names: Tuple[str, ...],
+    chunk_rows: int = COLUMN_CHUNK_ROWS,
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Read selected columns of a TradeLogger file (any format) in chunks.
+
+    Yields {name: array} for at most chunk_rows rows at a time (one
+    record batch per chunk for Arrow), so memory stays bounded however
+    long the history is. Text columns (TradeLogger.STR_COLUMNS) are str
+    arrays, the rest float64. A column missing from the file reads as
+    "" / 0.0; rows with an unparseable number are skipped with a warning.
+    """
+    path = Path(path)
+    if path.suffix == LOG_SUFFIXES["arrow"]:
+        for batch in _arrow_batches(path):
+            present = batch.schema.names
+            yield _typed_columns(names, batch.num_rows, {
+                name: batch.column(name).to_numpy(zero_copy_only=False)
+                for name in names if name in present
+            })
+
+    elif path.suffix == LOG_SUFFIXES["msgpack"]:
+        rows = read_trade_rows(path)
+        while chunk := list(itertools.islice(rows, chunk_rows)):
+            yield _typed_columns(names, len(chunk), {
+                name: np.array([row.get(name) for row in chunk]) for name in names
+            })
+
+    else:
+        with open(path, "r", newline="") as f:
+            header = next(csv.reader([f.readline()]), [])
+            wanted = [h for h in names if h in header]
+            usecols = [header.index(h) for h in wanted]
+            while lines := list(itertools.islice(f, chunk_rows)):
+                data = _parse_csv_lines(lines, usecols)
+                yield _typed_columns(names, len(data), {
+                    name: data[:, j] for j, name in enumerate(wanted)
+                })
+
+
+def read_trade_columns(path: "str | Path", names: Tuple[str, ...]) -> Dict[str, np.ndarray]:
+    """All rows of iter_trade_columns() concatenated into one array per column."""
+    chunks = list(iter_trade_columns(path, names))
+    if not chunks:
+        return _typed_columns(names, 0, {})
+    return {name: np.concatenate([c[name] for c in chunks]) for name in names}
+
+
+def _typed_columns(names: Tuple[str, ...], n_rows: int, columns: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """Cast columns to str / float64; rows with an unparseable number are dropped."""
+    out: Dict[str, np.ndarray] = {}
+    bad = None
+    for name in names:
+        is_str = name in TradeLogger.STR_COLUMNS
+        col = columns.get(name)
+        if col is None or len(col) != n_rows:  # column absent from the file
+            col = np.full(n_rows, "" if is_str else 0.0)
+        if is_str:
+            out[name] = col.astype(str)
+            continue
+        try:
+            out[name] = col.astype(np.float64)
+        except (ValueError, TypeError):
+            # Slow path, only for a chunk holding a corrupt value
+            values = np.array([_float_or_nan(v) for v in col], dtype=np.float64)
+            invalid = np.isnan(values)
+            bad = invalid if bad is None else bad | invalid
+            out[name] = values
+
+    if bad is not None and bad.any():
+        logger.warning(f"Skipping {int(bad.sum())} unparseable row(s) in trade log")
+        out = {name: col[~bad] for name, col in out.items()}
+    return out
+
+
+def _float_or_nan(value: Any) -> float:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return float("nan")
+
+
+def _parse_csv_lines(lines: List[str], usecols: List[int]) -> np.ndarray:
+    """
+    2-D str array of the given columns of some CSV lines.
+
+    np.loadtxt parses them in C; if it rejects the chunk, csv.reader is
+    used instead and rows too short to hold every column (a torn final
+    write, a legacy row) are skipped.
+    """
+    if not usecols:
+        return np.empty((len(lines), 0), dtype=str)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)  # blank lines only
+            return np.loadtxt(
+                lines, delimiter=",", quotechar='"', dtype=str,
+                usecols=usecols, ndmin=2,
+            )
+    except ValueError:
+        width = max(usecols) + 1
+        rows = [[row[i] for i in usecols] for row in csv.reader(lines) if len(row) >= width]
+        skipped = sum(1 for line in lines if line.strip()) - len(rows)
+        if skipped > 0:
+            logger.warning(f"Skipping {skipped} short row(s) in trade log")
+        return np.array(rows, dtype=str).reshape(-1, len(usecols))
+
+
+def read_trade_rows(path: "str | Path") -> Iterator[Dict[str, Any]]:
+    """
+    Iterate resolved trade rows from a TradeLogger file of any format.
+
+    The format is picked from the suffix (.csv, .mpk, .arrow). CSV rows
+    yield strings; binary rows yield typed values.
+    """
+    path = Path(path)
+    if path.suffix == LOG_SUFFIXES["msgpack"]:
+        ormsgpack = _load_codec("msgpack")
+        with open(path, "rb") as f:
+            data = f.read()
+        pos, end = 0, len(data)
+        while pos + _MPK_LEN.size <= end:
+            (size,) = _MPK_LEN.unpack_from(data, pos)
+            pos += _MPK_LEN.size
+            if pos + size > end:
+                break  # torn tail from an interrupted write
+            yield ormsgpack.unpackb(data[pos:pos + size])
+            pos += size
+
+    elif path.suffix == LOG_SUFFIXES["arrow"]:
+        for batch in _arrow_batches(path):
+            yield from batch.to_pylist()
+
+    else:
+        with open(path, "r", newline="") as f:
+            yield from csv.DictReader(f)
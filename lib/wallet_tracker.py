@@ -4,8 +4,13 @@ Alpha Wallet Tracker — polls top trader activity and detects new trades.
 Maintains a set of "alpha wallets" (proven profitable traders) and watches
 for their new BUY trades. When a new trade is detected, it's emitted as a
 CopySignal for the CopySniper strategy to evaluate.
+
+Leaderboard discovery and wallet polling fan out concurrently over the
+Data API's pooled session, so a poll cycle costs ~one round trip rather
+than one per wallet.
 """
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
@@ -90,15 +95,18 @@ class WalletTracker:
     # Alpha wallet discovery
     # ------------------------------------------------------------------
 
-    def discover_alphas(self) -> List[AlphaWallet]:
+    async def discover_alphas(self) -> List[AlphaWallet]:
         """
         Pull leaderboard across all categories and build alpha wallet list.
         Should be called once at startup and then periodically (e.g. daily).
+        Between refreshes the wallet list is cached, so only the per-wallet
+        activity calls sit on the polling path.
         """
         logger.info("Discovering alpha wallets across categories...")
-        all_leaders = self.api.get_top_traders_all_categories(
+        all_leaders = await self.api.get_top_traders_all_categories_async(
             time_period="WEEK",
             limit_per_category=self.wallets_per_category,
+            categories=self.categories,
         )
 
         new_alphas: Dict[str, AlphaWallet] = {}
@@ -136,26 +144,31 @@ class WalletTracker:
     # Poll for new trades
     # ------------------------------------------------------------------
 
-    def poll_new_trades(self) -> List[CopySignal]:
+    async def poll_new_trades(self) -> List[CopySignal]:
         """
         Poll all alpha wallets for new BUY trades since last check.
         Returns list of CopySignals for new trades.
+
+        All wallets are requested concurrently; the API client's
+        max_concurrency bounds how many are in flight at once.
         """
         signals: List[CopySignal] = []
         now = int(time.time())
 
-        for addr, alpha in self.alphas.items():
-            # Get timestamp of last poll (default: 5 minutes ago)
-            since_ts = self.last_poll_ts.get(addr, now - 300)
+        wallets = list(self.alphas.items())
+        # Timestamp of last poll per wallet (default: 5 minutes ago)
+        since = [self.last_poll_ts.get(addr, now - 300) for addr, _ in wallets]
+        results = await asyncio.gather(
+            *(
+                self.api.get_buys_async(user=addr, since_timestamp=since_ts, limit=20)
+                for (addr, _), since_ts in zip(wallets, since)
+            ),
+            return_exceptions=True,
+        )
 
-            try:
-                buys = self.api.get_buys(
-                    user=addr,
-                    since_timestamp=since_ts,
-                    limit=20,
-                )
-            except Exception as e:
-                logger.warning(f"Failed to poll {alpha.username}: {e}")
+        for (addr, alpha), since_ts, buys in zip(wallets, since, results):
+            if isinstance(buys, BaseException):
+                logger.warning(f"Failed to poll {alpha.username}: {buys}")
                 continue
 
             for trade in buys:
@@ -190,9 +203,6 @@ class WalletTracker:
             # Update last poll timestamp
             self.last_poll_ts[addr] = now
 
-            # Small delay between wallet polls to avoid rate limiting
-            time.sleep(0.1)
-
         if signals:
             logger.info(f"Detected {len(signals)} new alpha trades")
 
@@ -0,0 +1,362 @@
+"""
+WebSocket Price Feed Base — Shared state, volatility and reconnect loop.
+
+Common machinery behind BinancePriceFeed and ChainlinkPriceFeed:
+- Per-coin CoinState with a ring buffer of price samples
+- Rolling realized volatility and momentum from those samples
+- start/stop and the auto-reconnecting WebSocket loop
+
+Subclasses provide the coin -> symbol table, the stream URL, an optional
+on-connect hook (subscribe / keepalive) and the message parser.
+
+Usage:
+    class MyFeed(WsPriceFeed):
+        SYMBOLS = {"BTC": "btcusd"}
+
+        def _ws_url(self) -> str:
+            return "wss://example.com/ws"
+
+        def _handle_message(self, raw: str) -> None:
+            ...  # parse, then update self._state[coin]
+"""
+
+import asyncio
+import math
+import time
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Seconds in a year for annualization
+SECONDS_PER_YEAR = 365.25 * 24 * 3600
+
+# Price samples kept per coin for volatility / momentum
+HISTORY_LEN = 600
+
+# Annualized volatility: default when data is insufficient, and clamp range
+VOL_DEFAULT = 0.50
+VOL_MIN = 0.10
+VOL_MAX = 2.0
+
+
+@dataclass
+class CoinState:
+    """Tracks price and volatility state for a single coin."""
+    symbol: str
+    price: float = 0.0
+    last_update: float = 0.0
+    # Rolling price samples as a ring buffer of float64 arrays
+    # (structure-of-arrays): `head` is the next slot to write, `count`
+    # the number of valid slots. No per-sample object allocation.
+    # log_prices is filled at sample time (NaN for a non-positive price)
+    # so log returns are plain differences.
+    prices: np.ndarray = field(default_factory=lambda: np.zeros(HISTORY_LEN))
+    times: np.ndarray = field(default_factory=lambda: np.zeros(HISTORY_LEN))
+    log_prices: np.ndarray = field(default_factory=lambda: np.zeros(HISTORY_LEN))
+    # Contribution of the pair (slot i -> next sample): squared log return
+    # and dt, 0.0 when the pair is invalid or the next sample is pending.
+    pair_sq: np.ndarray = field(default_factory=lambda: np.zeros(HISTORY_LEN))
+    pair_dt: np.ndarray = field(default_factory=lambda: np.zeros(HISTORY_LEN))
+    head: int = 0
+    count: int = 0
+    # Running sums over the valid pairs in the window, updated on every
+    # append/eviction so volatility is O(1)
+    sum_sq: float = 0.0
+    sum_dt: float = 0.0
+    n_pairs: int = 0
+    # Earliest timestamp at which the next sample is taken
+    next_sample_ts: float = 0.0
+
+    def add_sample(self, price: float, ts: float) -> None:
+        """Append a sample, overwriting the oldest once the ring is full."""
+        i = self.head
+        if self.count == HISTORY_LEN:
+            # Evict the oldest sample along with its pair to the next one
+            if self.pair_dt[i] > 0:
+                self.sum_sq -= self.pair_sq[i]
+                self.sum_dt -= self.pair_dt[i]
+                self.n_pairs -= 1
+        else:
+            self.count += 1
+
+        log_price = math.log(price) if price > 0 else math.nan
+        self.prices[i] = price
+        self.times[i] = ts
+        self.log_prices[i] = log_price
+        self.pair_sq[i] = 0.0
+        self.pair_dt[i] = 0.0
+
+        # Pair (previous newest -> this sample)
+        if self.count > 1:
+            j = i - 1 if i else HISTORY_LEN - 1
+            log_ret = log_price - self.log_prices[j]
+            dt = ts - self.times[j]
+            if dt > 0 and not math.isnan(log_ret):
+                sq = log_ret * log_ret
+                self.pair_sq[j] = sq
+                self.pair_dt[j] = dt
+                self.sum_sq += sq
+                self.sum_dt += dt
+                self.n_pairs += 1
+
+        self.head = (i + 1) % HISTORY_LEN
+        if self.head == 0 and self.count == HISTORY_LEN:
+            # Once per lap, re-sum exactly so add/subtract rounding can't drift
+            self.sum_sq = float(self.pair_sq.sum())
+            self.sum_dt = float(self.pair_dt.sum())
+
+    def samples(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(prices, times) oldest-first; views until the ring has wrapped."""
+        if self.count < HISTORY_LEN:
+            return self.prices[:self.count], self.times[:self.count]
+        h = self.head
+        return (
+            np.concatenate((self.prices[h:], self.prices[:h])),
+            np.concatenate((self.times[h:], self.times[:h])),
+        )
+
+
+class WsPriceFeed:
+    """
+    Base class for single-connection, multi-coin WebSocket price feeds.
+
+    Subclasses must set SYMBOLS and implement _ws_url() and
+    _handle_message(); _on_connect() is an optional hook.
+    """
+
+    # Coin -> feed symbol (set by subclass)
+    SYMBOLS: Dict[str, str] = {}
+    # Max seconds start() waits for a first price on every coin
+    START_TIMEOUT = 5.0
+    # Seconds to wait before reconnecting after an error
+    RECONNECT_DELAY = 2.0
+    # Protocol-level keepalive, handled inside websockets (no Python task)
+    PING_INTERVAL = 20.0
+    PING_TIMEOUT = 20.0
+
+    def __init__(
+        self,
+        coins: list[str] | None = None,
+        vol_window_seconds: int = 300,
+        vol_sample_interval: float = 5.0,
+        vol_recalc_interval: float = 10.0,
+    ):
+        """
+        Args:
+            coins: List of coin symbols (default: ["BTC"])
+            vol_window_seconds: Window for volatility calculation (default: 5 min)
+            vol_sample_interval: Seconds between price samples for vol calc
+            vol_recalc_interval: Unused (volatility is maintained
+                incrementally); kept for call-site compatibility
+        """
+        self.coins = [c.upper() for c in (coins or ["BTC"])]
+        self.vol_window_seconds = vol_window_seconds
+        self.vol_sample_interval = vol_sample_interval
+        self.vol_recalc_interval = vol_recalc_interval
+
+        # State per coin
+        self._state: Dict[str, CoinState] = {}
+        for coin in self.coins:
+            sym = self.SYMBOLS.get(coin)
+            if not sym:
+                raise ValueError(f"Unsupported coin: {coin}. Use: {list(self.SYMBOLS.keys())}")
+            self._state[coin] = CoinState(symbol=sym)
+
+        # Payload symbol -> (coin, state): one dict lookup per message
+        # resolves both, instead of symbol -> coin -> self._state[coin].
+        # _state stays the public-facing map (MultiPriceFeed reads it).
+        self._by_symbol: Dict[str, Tuple[str, CoinState]] = {
+            self._payload_symbol(st.symbol): (coin, st) for coin, st in self._state.items()
+        }
+
+        # Coins still waiting for their first price; _ready is set once
+        # this empties so start() wakes immediately instead of polling
+        self._awaiting_first = set(self.coins)
+        self._ready = asyncio.Event()
+
+        self._ws = None
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+    @property
+    def connected(self) -> bool:
+        return self._running and self._ws is not None
+
+    def get_price(self, coin: str = "BTC") -> float:
+        """Get latest price for a coin. Returns 0.0 if unavailable."""
+        state = self._state.get(coin.upper())
+        return state.price if state else 0.0
+
+    def get_age(self, coin: str = "BTC") -> float:
+        """Get seconds since last price update."""
+        state = self._state.get(coin.upper())
+        if not state or state.last_update == 0:
+            return float("inf")
+        return time.time() - state.last_update
+
+    def get_volatility(self, coin: str = "BTC") -> float:
+        """
+        Get annualized realized volatility for a coin.
+
+        Maintained incrementally as samples arrive, so this is O(1) and
+        always current. Returns VOL_DEFAULT (0.50) if insufficient data.
+        """
+        coin = coin.upper()
+        if coin not in self._state:
+            return VOL_DEFAULT
+        return self._calculate_volatility(coin)
+
+    def get_momentum(self, coin: str, lookback_seconds: float = 30.0) -> float:
+        """
+        Return price change % over last N seconds. Positive = price going up.
+
+        Used as a momentum filter: only enter trades when the spot price
+        is moving in the direction of our bet.
+        """
+        coin = coin.upper()
+        state = self._state.get(coin)
+        if not state or not state.count:
+            return 0.0
+
+        current_price = state.price
+        if current_price <= 0:
+            return 0.0
+
+        # Find the most recent price at or before the cutoff time
+        cutoff = time.time() - lookback_seconds
+        prices, times = state.samples()
+        # Samples are time-ordered (sampling enforces a minimum spacing)
+        i = int(np.searchsorted(times, cutoff, side="right")) - 1
+        # If no point old enough, use the oldest available
+        past_price = float(prices[i if i >= 0 else 0])
+        if not past_price or past_price <= 0:
+            return 0.0
+
+        return (current_price - past_price) / past_price
+
+    def _calculate_volatility(self, coin: str) -> float:
+        """Calculate annualized realized volatility from price history."""
+        state = self._state[coin]
+
+        if state.count < 10 or state.n_pairs < 5:
+            return VOL_DEFAULT
+
+        # Variance of returns, annualized
+        # Use sum of squared returns / sum of dt (running sums over the
+        # valid consecutive-sample pairs), then annualize
+        sum_sq = state.sum_sq
+        sum_dt = state.sum_dt
+
+        if sum_dt <= 0 or sum_sq < 0:
+            return VOL_DEFAULT
+
+        # Variance per second, then annualize
+        var_per_sec = sum_sq / sum_dt
+        annualized_vol = math.sqrt(var_per_sec * SECONDS_PER_YEAR)
+
+        # Clamp to reasonable range
+        if annualized_vol < VOL_MIN:
+            return VOL_MIN
+        return VOL_MAX if annualized_vol > VOL_MAX else annualized_vol
+
+    async def start(self) -> bool:
+        """Start the WebSocket connection."""
+        if self._running:
+            return True
+
+        self._running = True
+        self._task = asyncio.create_task(self._run_loop())
+
+        # Wait for first price on every coin
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=self.START_TIMEOUT)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"{type(self).__name__}: timeout waiting for initial prices")
+            return self._running
+
+    async def stop(self):
+        """Stop the WebSocket connection."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _first_price(self, coin: str) -> None:
+        """Record a coin's first price; handlers call this while _awaiting_first."""
+        self._awaiting_first.discard(coin)
+        if not self._awaiting_first:
+            self._ready.set()
+
+    def _payload_symbol(self, symbol: str) -> str:
+        """How a SYMBOLS value appears in stream payloads (default: as-is)."""
+        return symbol
+
+    def _ws_url(self) -> str:
+        """URL to connect to (called on every (re)connect)."""
+        raise NotImplementedError
+
+    async def _on_connect(self, ws) -> None:
+        """Hook run right after connecting (e.g. send a subscription)."""
+
+    def _handle_message(self, raw: str) -> None:
+        """Parse one WebSocket frame and update coin state."""
+        raise NotImplementedError
+
+    async def _run_loop(self):
+        """Main WebSocket loop with auto-reconnect."""
+        try:
+            from websockets.asyncio.client import connect as ws_connect
+        except ImportError:
+            try:
+                import websockets
+                ws_connect = websockets.connect
+            except ImportError:
+                logger.error("websockets package required: pip install websockets")
+                self._running = False
+                return
+
+        name = type(self).__name__
+        while self._running:
+            try:
+                logger.info(f"{name} connecting: {self.coins}")
+
+                async with ws_connect(
+                    self._ws_url(),
+                    ping_interval=self.PING_INTERVAL,
+                    ping_timeout=self.PING_TIMEOUT,
+                ) as ws:
+                    self._ws = ws
+                    await self._on_connect(ws)
+                    logger.info(f"{name} connected")
+
+                    _msg_count = 0
+                    async for msg in ws:
+                        if not self._running:
+                            break
+                        self._handle_message(msg)
+                        # Yield to event loop every 50 messages to prevent
+                        # starvation of Polymarket WS tasks.  Without this,
+                        # a high-frequency stream keeps the websockets recv
+                        # buffer non-empty and `await recv()` resolves
+                        # synchronously, so this task never yields.
+                        _msg_count += 1
+                        if _msg_count % 50 == 0:
+                            await asyncio.sleep(0)
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"{name} error: {e}, reconnecting in {self.RECONNECT_DELAY:.0f}s")
+                self._ws = None
+                await asyncio.sleep(self.RECONNECT_DELAY)
+
+        self._ws = None
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Convert a binary TradeLogger file (.mpk / .arrow) to the standard trades CSV.
+
+Runners started with --log-format msgpack|arrow append resolved trades in
+binary form; this rebuilds the exact CSV that --log-format csv would have
+written, for analysis scripts that read data/*.csv.
+
+Usage:
+    python scripts/trades_to_csv.py data/trades.mpk
+    python scripts/trades_to_csv.py data/longshot_trades.arrow -o /tmp/longshot.csv
+"""
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lib.trade_logger import TradeLogger, read_trade_rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert .mpk/.arrow trade logs to CSV")
+    parser.add_argument("source", help="Binary trade log (.mpk or .arrow)")
+    parser.add_argument(
+        "-o", "--output",
+        help="Output CSV path (default: source with .converted.csv suffix)",
+    )
+    args = parser.parse_args()
+
+    src = Path(args.source)
+    if src.suffix not in (".mpk", ".arrow"):
+        print(f"Error: expected a .mpk or .arrow file, got {src}")
+        sys.exit(1)
+
+    # Never overwrite an existing CSV (live logs may sit next to the source)
+    out = Path(args.output) if args.output else src.with_suffix(".converted.csv")
+    if out.exists():
+        print(f"Error: {out} already exists — pick another path with -o")
+        sys.exit(1)
+
+    headers = TradeLogger.CSV_HEADERS
+    count = 0
+    with open(out, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        for row in read_trade_rows(src):
+            values = tuple(row.get(h, "" if h in TradeLogger.STR_COLUMNS else 0.0) for h in headers)
+            writer.writerow(TradeLogger.format_csv_row(values))
+            count += 1
+
+    print(f"Wrote {count} trades to {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,73 @@
 """
 HTTP Utilities - Shared HTTP session helpers.
 
-Provides a thread-local requests.Session mixin to avoid cross-thread reuse.
+Provides a thread-local requests.Session mixin to avoid cross-thread reuse,
+a pooled session factory for the read-only data feeds, and a circuit
+breaker so a down endpoint fails fast instead of stalling every caller.
 """
 
 import threading
+import time
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def pooled_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 20,
+    retries: int = 2,
+) -> requests.Session:
+    """
+    Build a keep-alive Session with a sized connection pool.
+
+    Connection errors are retried with a short backoff; read timeouts are
+    not, so a slow endpoint costs one timeout rather than several.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=retries, read=0, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class CircuitBreaker:
+    """
+    Fail-fast guard for a flaky endpoint.
+
+    After `max_failures` consecutive failures the breaker opens for
+    `cooldown` seconds: allow() returns False and callers skip the request
+    entirely. Any success closes it again.
+    """
+
+    def __init__(self, max_failures: int = 3, cooldown: float = 30.0) -> None:
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.failures = 0
+        self.open_until = 0.0
+
+    def allow(self) -> bool:
+        """True if a request may be attempted now."""
+        return time.monotonic() >= self.open_until
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.open_until = 0.0
+
+    def record_failure(self) -> bool:
+        """Count a failure; returns True if this one opened the breaker."""
+        self.failures += 1
+        if self.failures < self.max_failures:
+            return False
+        self.failures = 0
+        self.open_until = time.monotonic() + self.cooldown
+        return True
 
 
 class ThreadLocalSessionMixin:
@@ -15,17 +75,22 @@ class ThreadLocalSessionMixin:
     Mixin providing a thread-local requests.Session.
 
     Each thread gets its own Session instance to keep connections isolated.
+    Override _new_session() to customize how each Session is built.
     """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self._session_local = threading.local()
         super().__init__(*args, **kwargs)
 
+    def _new_session(self) -> requests.Session:
+        """Create the Session for the current thread."""
+        return requests.Session()
+
     def _get_session(self) -> requests.Session:
         """Get a thread-local session to avoid cross-thread reuse."""
         session = getattr(self._session_local, "session", None)
         if session is None:
-            session = requests.Session()
+            session = self._new_session()
             self._session_local.session = session
         return session
 
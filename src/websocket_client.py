@@ -20,7 +20,9 @@ Example:
 
 import json
 import asyncio
+import orjson  # fast JSON parse on WS hot path
 import logging
+import time
 from typing import Optional, Dict, Any, List, Callable, Set, Union, Awaitable, TYPE_CHECKING
 from dataclasses import dataclass, field
 
@@ -34,6 +36,9 @@ logger = logging.getLogger(__name__)
 WSS_MARKET_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
 WSS_USER_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
 
+# Reconnect backoff: 0.5s, 1s, 2s, 4s, then capped at reconnect_interval
+RECONNECT_BACKOFF_BASE = 0.5
+
 
 def _load_websockets():
     """Resolve WebSocket client functions without importing legacy APIs."""
@@ -49,6 +54,124 @@ def _load_websockets():
             return None, Exception
 
 
+def _backoff_delay(attempt: int, cap: float) -> float:
+    """Exponential reconnect delay for the given attempt, capped at `cap`."""
+    return min(cap, RECONNECT_BACKOFF_BASE * (2 ** attempt))
+
+
+class HeartbeatGuard:
+    """
+    Application-layer heartbeat for a Polymarket WebSocket.
+
+    Protocol ping/pong frames can be answered by a load balancer or proxy
+    while the upstream feed is dead, leaving a "zombie" socket that never
+    delivers another book. Polymarket answers a text "PING" with "PONG"
+    from the application itself, so a missed PONG is a reliable stall signal.
+
+    Every `interval` seconds a PING is sent; if no PONG arrives within
+    `timeout` the client is force-reconnected. Detection is bounded by
+    interval + timeout instead of the 60-120s NAT idle timeout.
+
+    RTT is tracked as an EMA against the lowest RTT seen (baseline); a
+    warning is logged when the EMA exceeds 2x baseline.
+    """
+
+    PING_MESSAGE = "PING"
+    PONG_MESSAGE = "PONG"
+    RTT_EMA_ALPHA = 0.2
+    RTT_WARN_RATIO = 2.0
+
+    def __init__(self, client: Any, interval: float = 25.0, timeout: float = 10.0):
+        """
+        Initialize heartbeat guard.
+
+        Args:
+            client: WebSocket client exposing is_connected, send_raw() and force_reconnect()
+            interval: Seconds between heartbeats (0 disables)
+            timeout: Seconds to wait for PONG before reconnecting
+        """
+        self.client = client
+        self.interval = interval
+        self.timeout = timeout
+
+        self.rtt_ema: Optional[float] = None
+        self.rtt_baseline: Optional[float] = None
+        self.missed = 0
+
+        self._pong = asyncio.Event()
+        self._degraded = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0
+
+    def on_pong(self) -> None:
+        """Mark the outstanding heartbeat as answered."""
+        self._pong.set()
+
+    def _record_rtt(self, rtt: float) -> None:
+        """Update RTT EMA/baseline and warn on degradation transitions."""
+        if self.rtt_ema is None:
+            self.rtt_ema = rtt
+        else:
+            self.rtt_ema += self.RTT_EMA_ALPHA * (rtt - self.rtt_ema)
+        if self.rtt_baseline is None or rtt < self.rtt_baseline:
+            self.rtt_baseline = rtt
+
+        degraded = self.rtt_ema > self.RTT_WARN_RATIO * self.rtt_baseline
+        if degraded and not self._degraded:
+            logger.warning(
+                f"WS heartbeat RTT degraded: ema={self.rtt_ema * 1000:.0f}ms "
+                f"baseline={self.rtt_baseline * 1000:.0f}ms"
+            )
+        elif self._degraded and not degraded:
+            logger.info(f"WS heartbeat RTT recovered: ema={self.rtt_ema * 1000:.0f}ms")
+        self._degraded = degraded
+
+    async def run(self) -> None:
+        """Heartbeat loop for one connection; returns when it drops."""
+        while self.client.is_connected:
+            await asyncio.sleep(self.interval)
+            if not self.client.is_connected:
+                return
+
+            self._pong.clear()
+            sent_at = time.monotonic()
+            try:
+                await self.client.send_raw(self.PING_MESSAGE)
+                await asyncio.wait_for(self._pong.wait(), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                self.missed += 1
+                logger.warning(
+                    f"No PONG within {self.timeout:.0f}s (missed={self.missed}), "
+                    f"forcing reconnect"
+                )
+                await self.client.force_reconnect()
+                return
+            except Exception:
+                # Send failed: socket is already closing, run loop will reconnect
+                return
+
+            self._record_rtt(time.monotonic() - sent_at)
+
+    def start(self) -> Optional[asyncio.Task]:
+        """Start the heartbeat task for the current connection."""
+        if not self.enabled:
+            return None
+        return asyncio.create_task(self.run())
+
+    @staticmethod
+    async def stop(task: Optional[asyncio.Task]) -> None:
+        """Cancel a heartbeat task returned by start()."""
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
 @dataclass
 class OrderbookLevel:
     """Single level in the orderbook."""
@@ -196,6 +319,8 @@ class MarketWebSocket:
         ping_interval: float = 20.0,
         ping_timeout: float = 10.0,
         msg_skip_rate: int = 10,
+        heartbeat_interval: float = 25.0,
+        heartbeat_timeout: float = 10.0,
     ):
         """
         Initialize WebSocket client.
@@ -206,6 +331,8 @@ class MarketWebSocket:
             ping_interval: Seconds between ping messages
             ping_timeout: Seconds to wait for pong response
             msg_skip_rate: Process 1 in N messages (1=all, 10=default)
+            heartbeat_interval: Seconds between app-level PING messages (0=off)
+            heartbeat_timeout: Seconds to wait for PONG before reconnecting
         """
         self.url = url
         self.reconnect_interval = reconnect_interval
@@ -214,6 +341,8 @@ class MarketWebSocket:
         self.msg_skip_rate = msg_skip_rate
 
         self._ws_connect, self._connection_closed = _load_websockets()
+        self._heartbeat = HeartbeatGuard(self, heartbeat_interval, heartbeat_timeout)
+        self._reconnect_attempts = 0
 
         # Connection state
         self._ws: Optional["WebSocketClientProtocol"] = None
@@ -343,6 +472,12 @@ class MarketWebSocket:
                 pass
             self._ws = None
 
+    async def send_raw(self, message: str) -> None:
+        """Send a raw text frame (used for app-level heartbeats)."""
+        if self._ws is None:
+            raise RuntimeError("WebSocket not connected")
+        await self._ws.send(message)
+
     async def subscribe(self, asset_ids: List[str], replace: bool = False) -> bool:
         """
         Subscribe to market data for assets.
@@ -513,13 +648,17 @@ class MarketWebSocket:
                         break
                     continue
 
+                if message == HeartbeatGuard.PONG_MESSAGE:
+                    self._heartbeat.on_pong()
+                    continue
+
                 msg_count += 1
 
                 # Log first 5 messages, then every 1000
                 if msg_count <= 5 or msg_count % 1000 == 0:
                     logger.info(f"WS message #{msg_count}: {message[:200] if len(message) > 200 else message}")
 
-                data = json.loads(message)
+                data = orjson.loads(message)
 
                 # Reset empty counter on successful parse
                 empty_count = 0
@@ -556,7 +695,7 @@ class MarketWebSocket:
             except self._connection_closed as e:
                 logger.warning(f"WebSocket connection closed: {e}")
                 break
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # Non-JSON messages are normal on Polymarket (market transitions).
                 # Don't count toward empty_count — just skip silently.
                 continue
@@ -578,19 +717,23 @@ class MarketWebSocket:
             # Connect
             if not await self.connect():
                 if auto_reconnect:
-                    logger.info(f"Reconnecting in {self.reconnect_interval}s...")
-                    await asyncio.sleep(self.reconnect_interval)
+                    await self._reconnect_backoff()
                     continue
                 else:
                     break
+            self._reconnect_attempts = 0
 
             # Subscribe to assets
             if self._subscribed_assets:
                 logger.info(f"Sending subscription for {len(self._subscribed_assets)} assets after connect")
                 await self.subscribe(list(self._subscribed_assets))
 
-            # Run message loop
-            await self._run_loop()
+            # Run message loop with app-level heartbeat alongside
+            heartbeat_task = self._heartbeat.start()
+            try:
+                await self._run_loop()
+            finally:
+                await HeartbeatGuard.stop(heartbeat_task)
 
             # Handle disconnect
             if self._on_disconnect:
@@ -600,11 +743,17 @@ class MarketWebSocket:
                 break
 
             if auto_reconnect:
-                logger.info(f"Reconnecting in {self.reconnect_interval}s...")
-                await asyncio.sleep(self.reconnect_interval)
+                await self._reconnect_backoff()
             else:
                 break
 
+    async def _reconnect_backoff(self) -> None:
+        """Sleep with exponential backoff capped at reconnect_interval."""
+        delay = _backoff_delay(self._reconnect_attempts, self.reconnect_interval)
+        self._reconnect_attempts += 1
+        logger.info(f"Reconnecting in {delay:.1f}s...")
+        await asyncio.sleep(delay)
+
     async def run_until_cancelled(self) -> None:
         """Run until cancelled or stopped."""
         try:
@@ -755,6 +904,8 @@ class UserWebSocket:
         reconnect_interval: float = 5.0,
         ping_interval: float = 10.0,
         ping_timeout: float = 10.0,
+        heartbeat_interval: float = 25.0,
+        heartbeat_timeout: float = 10.0,
     ):
         self.api_key = api_key
         self.api_secret = api_secret
@@ -764,6 +915,8 @@ class UserWebSocket:
         self.ping_timeout = ping_timeout
 
         self._ws_connect, self._connection_closed = _load_websockets()
+        self._heartbeat = HeartbeatGuard(self, heartbeat_interval, heartbeat_timeout)
+        self._reconnect_attempts = 0
 
         self._ws = None
         self._running = False
@@ -829,6 +982,22 @@ class UserWebSocket:
             self._ws = None
             logger.info("User WebSocket disconnected")
 
+    async def force_reconnect(self) -> None:
+        """Close the socket but keep _running so run() reconnects and re-subscribes."""
+        logger.info("Force reconnecting User WebSocket...")
+        if self._ws:
+            try:
+                await self._ws.close()
+            except Exception:
+                pass
+            self._ws = None
+
+    async def send_raw(self, message: str) -> None:
+        """Send a raw text frame (used for app-level heartbeats)."""
+        if self._ws is None:
+            raise RuntimeError("User WebSocket not connected")
+        await self._ws.send(message)
+
     async def subscribe(self, condition_ids: List[str]) -> bool:
         """Subscribe to user events for given markets (condition IDs)."""
         if not self.is_connected:
@@ -935,8 +1104,12 @@ class UserWebSocket:
                 if not message or not message.strip():
                     continue
 
+                if message == HeartbeatGuard.PONG_MESSAGE:
+                    self._heartbeat.on_pong()
+                    continue
+
                 self._msg_count += 1
-                data = json.loads(message)
+                data = orjson.loads(message)
 
                 if isinstance(data, list):
                     for item in data:
@@ -949,7 +1122,7 @@ class UserWebSocket:
             except self._connection_closed:
                 logger.warning("User WebSocket connection closed")
                 break
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 continue
             except Exception as e:
                 logger.error(f"User WS error: {e}")
@@ -961,22 +1134,33 @@ class UserWebSocket:
         while self._running:
             if not await self.connect():
                 if auto_reconnect:
-                    await asyncio.sleep(self.reconnect_interval)
+                    await self._reconnect_backoff()
                     continue
                 break
+            self._reconnect_attempts = 0
 
             if self._subscribed_markets:
                 await self.subscribe(list(self._subscribed_markets))
 
-            await self._run_loop()
+            heartbeat_task = self._heartbeat.start()
+            try:
+                await self._run_loop()
+            finally:
+                await HeartbeatGuard.stop(heartbeat_task)
 
             if not self._running:
                 break
             if auto_reconnect:
-                logger.info(f"User WS reconnecting in {self.reconnect_interval}s...")
-                await asyncio.sleep(self.reconnect_interval)
+                await self._reconnect_backoff()
             else:
                 break
 
+    async def _reconnect_backoff(self) -> None:
+        """Sleep with exponential backoff capped at reconnect_interval."""
+        delay = _backoff_delay(self._reconnect_attempts, self.reconnect_interval)
+        self._reconnect_attempts += 1
+        logger.info(f"User WS reconnecting in {delay:.1f}s...")
+        await asyncio.sleep(delay)
+
     def stop(self):
         self._running = False
@@ -48,6 +48,8 @@ class StrategyConfig:
     market_check_interval: float = 30.0
     auto_switch_market: bool = True
     timeframe: str = "15m"  # "5m" or "15m"
+    heartbeat_interval: float = 25.0  # App-level WS PING cadence (0=off)
+    heartbeat_timeout: float = 10.0  # Reconnect if no PONG within this
 
     # Price tracking
     price_lookback_seconds: int = 10
@@ -86,6 +88,8 @@ class BaseStrategy(ABC):
             market_check_interval=config.market_check_interval,
             auto_switch_market=config.auto_switch_market,
             timeframe=config.timeframe,
+            heartbeat_interval=config.heartbeat_interval,
+            heartbeat_timeout=config.heartbeat_timeout,
         )
 
         self.prices = PriceTracker(
@@ -226,6 +230,10 @@ class BaseStrategy(ABC):
 
         return True
 
+    def request_stop(self) -> None:
+        """Ask the main loop to exit; cleanup runs in run()'s finally."""
+        self.running = False
+
     async def stop(self) -> None:
         """Stop the strategy."""
         self.running = False
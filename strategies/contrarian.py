@@ -32,6 +32,7 @@ from typing import Dict, Optional, List
 
 from lib.console import Colors, format_countdown, StatusDisplay
 from lib.price_feed import PriceFeed
+from lib.sizing import kelly_fraction
 from lib.trade_logger import TradeLogger
 from lib.volatility_tracker import VolatilityTracker
 from strategies.base import BaseStrategy, StrategyConfig
@@ -72,6 +73,9 @@ class ContrarianConfig(StrategyConfig):
 
     # Trade log file
     log_file: str = "data/trades.csv"
+    log_buffer_rows: int = 32        # Resolved rows buffered before a CSV append
+    log_flush_interval: float = 5.0  # Max seconds a buffered row waits for disk (checked every tick)
+    log_format: str = "csv"          # "csv", "msgpack" (.mpk) or "arrow" (.arrow)
 
     def __post_init__(self):
         # Override base class TP/SL - we don't use them
@@ -94,7 +98,12 @@ class ContrarianStrategy(BaseStrategy):
         self.cc = config  # Shorthand for contrarian config
 
         # Trade logger
-        self.logger = TradeLogger(config.log_file)
+        self.logger = TradeLogger(
+            config.log_file,
+            buffer_rows=config.log_buffer_rows,
+            flush_interval=config.log_flush_interval,
+            log_format=config.log_format,
+        )
 
         # Volatility tracker
         self.vol_tracker = VolatilityTracker(window_seconds=1800)
@@ -125,6 +134,20 @@ class ContrarianStrategy(BaseStrategy):
         # Display
         self._display = StatusDisplay()
 
+    async def start(self) -> bool:
+        """Start the strategy plus the spot price stream."""
+        if not await super().start():
+            return False
+        if not await self.price_feed.start_stream():
+            self.log(f"No {self.cc.coin} spot stream - using REST price", "info")
+        return True
+
+    async def stop(self) -> None:
+        """Stop the strategy and the spot price feed."""
+        self.price_feed.stop()
+        await self.price_feed.stop_stream()
+        await super().stop()
+
     async def on_book_update(self, snapshot: OrderbookSnapshot) -> None:
         """Record price data for volatility tracking."""
         # Track the "up" side price for volatility calculation
@@ -140,6 +163,7 @@ class ContrarianStrategy(BaseStrategy):
         within our target range and place a trade if conditions are met.
         """
         self._markets_scanned += 1
+        self.logger.flush_if_due()
 
         if not prices:
             return
@@ -214,16 +238,11 @@ class ContrarianStrategy(BaseStrategy):
         Returns:
             Bet size in USDC, or 0 if no edge.
         """
-        p = self.cc.estimated_win_rate
-        P = market_price
-
-        # No edge = no bet
-        if p <= P:
+        # Full Kelly fraction (0 = no edge = no bet)
+        full_kelly = kelly_fraction(self.cc.estimated_win_rate, market_price)
+        if full_kelly <= 0:
             return 0.0
 
-        # Full Kelly fraction
-        full_kelly = (p - P) / (1 - P)
-
         # Apply fractional Kelly (e.g., 1/4 Kelly)
         kelly_f = full_kelly * self.cc.kelly_fraction
 
@@ -536,13 +555,12 @@ class ContrarianStrategy(BaseStrategy):
             )
 
         # Per-bucket performance (if any trades)
-        if stats.bucket_trades:
+        buckets = stats.active_buckets()
+        if buckets:
             d.add_separator()
             d.add_header("Performance by Entry Price")
-            for cents in sorted(stats.bucket_trades.keys()):
-                trades = stats.bucket_trades[cents]
-                wins = stats.bucket_wins.get(cents, 0)
-                wr = stats.bucket_win_rate(cents)
+            for cents, trades, wins in buckets:
+                wr = wins / trades * 100
                 payout_mult = 1.0 / (cents / 100) if cents > 0 else 0
                 d.add_line(
                     f"  ${cents/100:.2f} ({payout_mult:.0f}x): "
@@ -14,14 +14,15 @@ import csv
 import json
 import logging
 import time
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
 import requests
 
-from lib.leaderboard_api import PolymarketDataAPI
+from lib.leaderboard_api import DEFAULT_CACHE_DIR, PolymarketDataAPI
+from lib.sizing import kelly_fraction
 from lib.wallet_tracker import AlphaWallet, CopySignal, WalletTracker
 
 logger = logging.getLogger(__name__)
@@ -41,6 +42,8 @@ class CopySniperConfig:
     poll_interval: int = 60         # seconds between polls
     settle_interval: int = 60       # seconds between settlement checks
     alpha_refresh_hours: int = 12   # refresh alpha wallets every N hours
+    http_concurrency: int = 32      # pooled Data API connections for wallet polling
+    http2: bool = False             # multiplex Data API polling over HTTP/2 (httpx[http2])
     # Filters
     max_slippage: float = 0.05      # max price move since alpha trade (5 cents)
     min_liquidity: float = 100      # minimum market liquidity ($)
@@ -90,7 +93,7 @@ class CopySniper:
 
     def __init__(self, config: CopySniperConfig):
         self.config = config
-        self.api = PolymarketDataAPI()
+        self.api = PolymarketDataAPI(cache_dir=DEFAULT_CACHE_DIR)
         self.tracker = WalletTracker(
             api=self.api,
             categories=config.categories,
@@ -200,9 +203,12 @@ class CopySniper:
             data = {}
             for key, pos in self.positions.items():
                 if not pos.resolved:
-                    data[key] = asdict(pos)
+                    # Scalar fields only, so the instance dict is enough
+                    # (asdict() deep-copies every field)
+                    data[key] = vars(pos)
             with open(self.pending_path, "w") as f:
-                json.dump(data, f, indent=2)
+                # Machine-only file: compact separators, no indentation
+                json.dump(data, f, separators=(",", ":"))
         except Exception as e:
             logger.error(f"Failed to save pending: {e}")
 
@@ -334,9 +340,7 @@ class CopySniper:
         wr = signal.alpha_wr if signal.alpha_wr > 0 else self.config.default_wr
         if current_price <= 0 or current_price >= 1:
             return None
-        b = (1.0 - current_price) / current_price  # net odds
-        kelly_f = (wr * b - (1 - wr)) / b if b > 0 else 0
-        kelly_f = max(0, min(kelly_f, self.config.max_position_pct))
+        kelly_f = min(kelly_fraction(wr, current_price), self.config.max_position_pct)
         kelly_f *= self.config.kelly_fraction  # half-Kelly
 
         bet_amount = self.balance * kelly_f
@@ -543,7 +547,16 @@ class CopySniper:
     # ------------------------------------------------------------------
 
     async def run(self):
-        """Main event loop."""
+        """Main event loop (owns the pooled Data API session)."""
+        await self.api.open_session(
+            concurrency=self.config.http_concurrency, http2=self.config.http2
+        )
+        try:
+            await self._run()
+        finally:
+            await self.api.close_session()
+
+    async def _run(self):
         print("\n" + "=" * 60)
         print("  COPY SNIPER — Alpha Wallet Copy-Trade System")
         print(f"  Mode: {'OBSERVE (paper)' if self.config.observe_only else 'LIVE'}")
@@ -556,7 +569,7 @@ class CopySniper:
 
         # Initial alpha discovery
         print("[CopySniper] Discovering alpha wallets...")
-        self.tracker.discover_alphas()
+        await self.tracker.discover_alphas()
         self.last_alpha_refresh = time.time()
         print(f"[CopySniper] Tracking {self.tracker.get_alpha_count()} alpha wallets\n")
 
@@ -576,11 +589,11 @@ class CopySniper:
                 # Refresh alphas periodically
                 if now - self.last_alpha_refresh > self.config.alpha_refresh_hours * 3600:
                     print("[CopySniper] Refreshing alpha wallets...")
-                    self.tracker.discover_alphas()
+                    await self.tracker.discover_alphas()
                     self.last_alpha_refresh = now
 
                 # Poll for new trades
-                signals = self.tracker.poll_new_trades()
+                signals = await self.tracker.poll_new_trades()
 
                 for signal in signals:
                     trade = self.evaluate_signal(signal)
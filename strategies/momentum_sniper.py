@@ -34,7 +34,7 @@ import math
 import threading
 import time
 from dataclasses import dataclass, field
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List, Sequence, Tuple
 from datetime import datetime, timezone, timedelta
 
 from lib.binance_ws import BinancePriceFeed
@@ -44,6 +44,7 @@ from lib.edge_model import EdgeModel
 from lib.console import Colors, LogBuffer, log
 from lib.trade_logger import TradeLogger
 from lib.signal_logger import SignalLogger, SignalRecord
+from lib.sizing import kelly_fraction
 from lib.shadow_logger import ShadowLogger
 from lib.market_manager import MarketManager, MarketInfo
 from src.bot import TradingBot, OrderResult
@@ -190,7 +191,7 @@ class SniperConfig:
     """Momentum sniper configuration."""
 
     # Coins to scan (more coins = more opportunities)
-    coins: List[str] = field(default_factory=lambda: ["BTC"])
+    coins: Sequence[str] = field(default_factory=lambda: ["BTC"])
     timeframe: str = "15m"
 
     # Edge thresholds
@@ -217,11 +218,12 @@ class SniperConfig:
     # Per-coin Kelly override: when min_size_mode is True, coins listed here
     # use Kelly sizing instead of min-size. Coins NOT listed stay at min-size.
     # Empty list = all coins follow min_size_mode setting.
-    kelly_coins: List[str] = field(default_factory=list)
+    kelly_coins: Sequence[str] = field(default_factory=list)
 
-    # Hour blocking: UTC hours to skip trading entirely.
-    # Empty list = trade all hours. E.g. [0, 2, 9, 16, 17] to block bad hours.
-    blocked_hours: List[int] = field(default_factory=list)
+    # Hour blocking: UTC hours to skip trading entirely, as a 24-bit mask
+    # (bit h set = skip hour h). 0 = trade all hours.
+    # E.g. hours 0, 2, 9 -> (1 << 0) | (1 << 2) | (1 << 9).
+    blocked_hours_mask: int = 0
 
     # Volatility filter: skip trading when realized vol exceeds this.
     # Data shows vol < 0.50 -> 35.8% WR vs 22.4% when vol > 0.50.
@@ -309,6 +311,8 @@ class SniperConfig:
 
     # Market settings
     market_check_interval: float = 30.0
+    heartbeat_interval: float = 25.0  # App-level WS PING cadence (0=off)
+    heartbeat_timeout: float = 10.0   # Reconnect if no PONG within this
 
     # Price source for fair value calculation.
     # "binance" = Binance WebSocket (fast but NOT settlement source)
@@ -326,6 +330,9 @@ class SniperConfig:
 
     # Logging
     log_file: str = "data/longshot_trades.csv"
+    log_buffer_rows: int = 32        # Resolved rows buffered before a CSV append
+    log_flush_interval: float = 5.0  # Max seconds a buffered row waits for disk (checked every tick)
+    log_format: str = "csv"          # "csv", "msgpack" (.mpk) or "arrow" (.arrow)
     observe_only: bool = False
 
     # --- Edge Amplifier features ---
@@ -1009,7 +1016,12 @@ class MomentumSniperStrategy:
         self.coin_states: Dict[str, CoinMarketState] = {}
 
         # Trade logger
-        self.trade_logger = TradeLogger(config.log_file)
+        self.trade_logger = TradeLogger(
+            config.log_file,
+            buffer_rows=config.log_buffer_rows,
+            flush_interval=config.log_flush_interval,
+            log_format=config.log_format,
+        )
 
         # Signal logger (Layer 1: captures all signal evaluations)
         self.signal_logger: Optional[SignalLogger] = None
@@ -2332,6 +2344,8 @@ class MomentumSniperStrategy:
                 market_check_interval=self.config.market_check_interval,
                 auto_switch_market=True,
                 timeframe=self.config.timeframe,
+                heartbeat_interval=self.config.heartbeat_interval,
+                heartbeat_timeout=self.config.heartbeat_timeout,
             )
 
             state = CoinMarketState(coin=coin, manager=manager)
@@ -2850,14 +2864,7 @@ class MomentumSniperStrategy:
         if entry_price <= 0.01 or entry_price >= 0.99 or fair_prob <= 0:
             return 0.0
 
-        p = fair_prob
-        q = 1.0 - p
-        b = (1.0 / entry_price) - 1.0
-
-        if b <= 0:
-            return 0.0
-
-        kelly_f = (p * b - q) / b
+        kelly_f = kelly_fraction(fair_prob, entry_price)
         if kelly_f <= 0:
             return 0.0
 
@@ -2920,10 +2927,8 @@ class MomentumSniperStrategy:
                     self._cb_paused_until = None
 
         # Hour blocking: skip trading entirely during blocked UTC hours
-        if self.config.blocked_hours:
-            import datetime as _dt
-            current_hour = _dt.datetime.utcnow().hour
-            if current_hour in self.config.blocked_hours:
+        if self.config.blocked_hours_mask:
+            if (self.config.blocked_hours_mask >> time.gmtime().tm_hour) & 1:
                 return []
 
         # Weekend blocking: skip Saturday (5) and Sunday (6) UTC
@@ -5932,6 +5937,7 @@ class MomentumSniperStrategy:
 
             while self.running:
                 await self._tick()
+                self.trade_logger.flush_if_due()
                 self._render_status()
                 # If a price update flagged an urgent coin, skip the sleep — evaluate NOW
                 if hasattr(self, '_urgent_coins') and self._urgent_coins:
@@ -5946,6 +5952,10 @@ class MomentumSniperStrategy:
             await self.stop()
             self._print_summary()
 
+    def request_stop(self):
+        """Ask the main loop to exit; stop() then runs from run()'s finally."""
+        self.running = False
+
     async def stop(self):
         """Stop the strategy."""
         self.running = False
@@ -5980,6 +5990,9 @@ class MomentumSniperStrategy:
                 await self._liq_tracker.stop()
             except Exception:
                 pass
+        # Release the Deribit fetch workers
+        if self._deribit_feed is not None:
+            self._deribit_feed.close()
 
     def _print_summary(self):
         """Print session summary."""
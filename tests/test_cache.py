@@ -0,0 +1,83 @@
+"""
+Unit tests for FileCache and Data API response caching.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import orjson
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.cache import FileCache
+from lib.leaderboard_api import PolymarketDataAPI
+
+
+class _Resp:
+    status_code = 200
+
+    def __init__(self, data):
+        self.content = orjson.dumps(data)
+
+
+def test_key_ignores_param_order():
+    assert FileCache.key("/p", {"a": 1, "b": 2}) == FileCache.key("/p", {"b": 2, "a": 1})
+    assert FileCache.key("/p", {"a": 1}) != FileCache.key("/q", {"a": 1})
+
+
+def test_entries_persist_and_expire(tmp_path):
+    cache = FileCache(str(tmp_path))
+    cache.set("k", [1, 2], ttl=60.0)
+    cache.set("old", [3], ttl=-1.0)
+
+    reopened = FileCache(str(tmp_path))
+    assert reopened.get("k") == [1, 2]
+    assert reopened.get("old") is None
+    assert reopened.get("missing") is None
+
+
+def test_data_api_caches_leaderboard_but_not_activity(tmp_path):
+    api = PolymarketDataAPI(cache_dir=str(tmp_path))
+    calls = []
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append(url)
+        return _Resp([{"rank": 1, "proxyWallet": "0xabc"}])
+
+    api.session.get = fake_get
+
+    api.get_leaderboard(category="SPORTS")
+    entries = api.get_leaderboard(category="SPORTS")
+    assert entries[0].address == "0xabc"
+    assert len(calls) == 1
+
+    api.get_activity(user="0xabc")
+    api.get_activity(user="0xabc")
+    assert len(calls) == 3
+
+
+def test_data_api_cache_is_opt_in():
+    assert PolymarketDataAPI()._cache is None
+
+
+def test_async_reads_use_cache_off_the_loop(tmp_path):
+    api = PolymarketDataAPI(cache_dir=str(tmp_path))
+    calls = []
+
+    class _Client:
+        async def get(self, url, params=None):
+            calls.append(url)
+            return _Resp([{"rank": 1, "proxyWallet": "0xabc"}])
+
+    api._session, api._http2 = _Client(), True
+
+    async def run():
+        await api.get_leaderboard_async(category="SPORTS")
+        return await api.get_leaderboard_async(category="SPORTS")
+
+    entries = asyncio.run(run())
+    assert entries[0].address == "0xabc"
+    assert len(calls) == 1
+    # Persisted for the next process too
+    assert PolymarketDataAPI(cache_dir=str(tmp_path)).get_leaderboard(category="SPORTS")[0].address == "0xabc"
@@ -0,0 +1,74 @@
+"""
+Unit tests for DeribitVolFeed caching and batched refresh.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.deribit_vol import DeribitVolFeed
+
+
+def _stub_fetch(feed: DeribitVolFeed, vols: dict) -> list:
+    calls = []
+
+    def fetch(coin):
+        calls.append(coin)
+        return vols.get(coin)
+
+    feed._fetch_dvol = fetch
+    return calls
+
+
+def test_stale_entry_refreshes_all_coins_at_once():
+    feed = DeribitVolFeed(coins=["BTC", "ETH", "SOL"])
+    calls = _stub_fetch(feed, {"BTC": 0.52, "ETH": 0.61})
+
+    assert feed.get_implied_vol("BTC") == 0.52
+    assert sorted(calls) == ["BTC", "ETH"]
+
+    # ETH was filled by the same refresh
+    assert feed.get_implied_vol("eth") == 0.61
+    assert len(calls) == 2
+
+
+def test_failed_fetch_returns_none_and_keeps_old_entry():
+    feed = DeribitVolFeed(coins=["BTC"], cache_ttl=0.0)
+    _stub_fetch(feed, {"BTC": 0.52})
+    assert feed.get_implied_vol("BTC") == 0.52
+
+    _stub_fetch(feed, {})
+    assert feed.get_implied_vol("BTC") is None
+    assert feed._cache["BTC"][0] == 0.52
+
+
+def test_repeated_failures_open_the_breaker():
+    feed = DeribitVolFeed(coins=["BTC"])
+    calls = _stub_fetch(feed, {})
+
+    for _ in range(3):
+        assert feed.get_implied_vol("BTC") is None
+    assert len(calls) == 3
+
+    # Breaker open: no HTTP until the cooldown passes
+    assert feed.get_implied_vol("BTC") is None
+    assert len(calls) == 3
+
+    feed._breaker.open_until = 0.0
+    _stub_fetch(feed, {"BTC": 0.52})
+    assert feed.get_implied_vol("BTC") == 0.52
+    assert feed._breaker.failures == 0
+
+
+def test_close_shuts_down_the_fetch_pool():
+    feed = DeribitVolFeed(coins=["BTC", "ETH"])
+    _stub_fetch(feed, {"BTC": 0.52, "ETH": 0.61})
+    assert feed.get_implied_vol("BTC") == 0.52
+    pool = feed._pool
+    assert pool is not None
+
+    feed.close()
+    assert feed._pool is None
+    assert pool._shutdown
+    feed.close()  # idempotent
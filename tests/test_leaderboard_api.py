@@ -0,0 +1,71 @@
+"""
+Unit tests for PolymarketDataAPI parsing.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import numpy as np
+import orjson
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.leaderboard_api import MAX_CONCURRENCY, PolymarketDataAPI
+
+POSITIONS = [
+    {"proxyWallet": "0xa", "size": 10, "cashPnl": 2.5, "curPrice": "0.61",
+     "outcomeIndex": 1, "redeemable": True, "title": "Will it rain?"},
+    {"proxyWallet": "0xa", "size": "4.5", "cashPnl": -1.0, "curPrice": None},
+]
+
+
+def _api(data) -> PolymarketDataAPI:
+    api = PolymarketDataAPI(cache_dir=None)
+    api._get = lambda path, params: data
+    return api
+
+
+def test_positions_columns_match_position_objects():
+    api = _api(POSITIONS)
+    cols = api.get_positions_columns("0xa")
+    objs = api.get_positions("0xa")
+
+    assert cols["size"].dtype == np.float64
+    for name in ("size", "cash_pnl", "cur_price", "outcome_index", "redeemable", "title"):
+        assert list(cols[name]) == [getattr(p, name) for p in objs]
+    assert cols["cash_pnl"][cols["redeemable"]].sum() == 2.5
+
+
+def test_positions_columns_empty():
+    cols = _api([]).get_positions_columns("0xa")
+    assert len(cols["size"]) == 0 and len(cols["wallet"]) == 0
+
+
+def test_async_reads_cap_requests_in_flight():
+    api = PolymarketDataAPI(cache_dir=None)
+    in_flight = peak = 0
+
+    class _Resp:
+        status_code = 200
+        content = orjson.dumps([])
+
+    class _Client:
+        async def get(self, url, params=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _Resp()
+
+    api._session, api._http2 = _Client(), True
+
+    async def run():
+        await asyncio.gather(
+            *(api.get_buys_async(user=f"0x{i}") for i in range(20)),
+            api.get_top_traders_all_categories_async(),
+        )
+
+    asyncio.run(run())
+    assert peak == MAX_CONCURRENCY
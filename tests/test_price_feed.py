@@ -0,0 +1,164 @@
+"""
+Unit tests for PriceFeed background refresh, staleness and the WS stream.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.price_feed import PriceFeed
+
+
+class _Resp:
+    def __init__(self, price: float):
+        self.price = price
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> dict:
+        return {"price": str(self.price)}
+
+
+class _Session:
+    """Serves `prices` in order (the last one repeats); fails when empty."""
+
+    def __init__(self, prices):
+        self.prices = list(prices)
+        self.calls = 0
+
+    def get(self, url, params=None, timeout=None):
+        self.calls += 1
+        if not self.prices:
+            raise ConnectionError("down")
+        return _Resp(self.prices.pop(0) if len(self.prices) > 1 else self.prices[0])
+
+
+def _feed(session: _Session, **kwargs) -> PriceFeed:
+    class _Feed(PriceFeed):
+        def _new_session(self):
+            return session
+
+    return _Feed(**kwargs)
+
+
+def _wait_for(cond, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if cond():
+            return True
+        time.sleep(0.005)
+    return cond()
+
+
+def test_background_thread_keeps_refreshing():
+    session = _Session([100.0, 101.0, 102.0])
+    feed = _feed(session, cache_seconds=0.02)
+    try:
+        assert _wait_for(lambda: feed.get_price() == 102.0)
+        assert session.calls >= 3
+    finally:
+        feed.stop()
+
+
+def test_cold_cache_fetches_inline():
+    feed = _feed(_Session([100.0]), cache_seconds=60.0)
+    try:
+        # No 0.0 while the background thread's first poll is in flight
+        assert feed.get_price() == 100.0
+    finally:
+        feed.stop()
+
+
+def test_stale_cache_returns_zero():
+    session = _Session([100.0])
+    feed = _feed(session, cache_seconds=60.0)
+    try:
+        assert feed.get_price() == 100.0
+        session.prices.clear()  # REST is down from here on
+        feed._cached_at = time.time() - 2 * feed.cache_seconds - 1
+        assert feed.get_price() == 0.0
+    finally:
+        feed.stop()
+
+
+def test_stop_joins_the_refresh_thread():
+    feed = _feed(_Session([100.0]), cache_seconds=60.0)
+    thread = feed._thread
+    assert thread.is_alive()
+
+    feed.stop()
+    assert not thread.is_alive()
+    assert feed._thread is None
+
+
+class _Stream:
+    """Stands in for BinancePriceFeed: fixed price, adjustable age."""
+
+    def __init__(self, coins=None, price: float = 200.0, age: float = 1.0):
+        self.coins = coins
+        self.price = price
+        self.age = age
+        self.started = self.stopped = False
+
+    def get_price(self, coin: str) -> float:
+        return self.price
+
+    def get_age(self, coin: str) -> float:
+        return self.age
+
+    async def start(self) -> bool:
+        self.started = True
+        return True
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+def test_fresh_stream_price_skips_rest_until_stale():
+    session = _Session([100.0])
+    feed = _feed(session, background=False)
+    feed._stream = _Stream(age=1.0)
+
+    assert feed.get_price() == 200.0
+    assert session.calls == 0
+
+    feed._stream.age = feed.STREAM_MAX_AGE + 1
+    assert feed.get_price() == 100.0
+    assert session.calls == 1
+
+
+def test_refresh_loop_polls_rest_only_while_stream_is_stale():
+    session = _Session([100.0])
+    feed = _feed(session, background=False, cache_seconds=0.02)
+    feed._stream = _Stream(age=1.0)
+    loop = threading.Thread(target=feed._refresh_loop, daemon=True)
+    loop.start()
+    try:
+        time.sleep(0.1)  # several refresh intervals
+        assert session.calls == 0
+
+        feed._stream.age = feed.STREAM_MAX_AGE + 1
+        assert _wait_for(lambda: session.calls > 0)
+    finally:
+        feed._stop.set()
+        loop.join(1.0)
+
+
+def test_start_and_stop_stream(monkeypatch):
+    monkeypatch.setattr("lib.binance_ws.BinancePriceFeed", _Stream)
+    feed = _feed(_Session([100.0]), background=False)
+
+    async def run():
+        assert await feed.start_stream()
+        stream = feed._stream
+        assert stream.started and stream.coins == ["BTC"]
+        await feed.stop_stream()
+        return stream
+
+    stream = asyncio.run(run())
+    assert stream.stopped and feed._stream is None
@@ -0,0 +1,170 @@
+"""
+Unit tests for the Binance / Chainlink price feed sample buffers.
+"""
+
+import asyncio
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.binance_ws import BinancePriceFeed, HISTORY_LEN
+from lib.chainlink_ws import ChainlinkPriceFeed
+
+
+def _reference_vol(samples):
+    """Plain-Python realized vol over (price, ts) samples, oldest first."""
+    returns = []
+    for (p0, t0), (p1, t1) in zip(samples, samples[1:]):
+        if p0 > 0 and p1 > 0 and t1 > t0:
+            returns.append((math.log(p1 / p0), t1 - t0))
+    if len(samples) < 10 or len(returns) < 5:
+        return 0.50
+    sum_sq = sum(r * r for r, _ in returns)
+    sum_dt = sum(dt for _, dt in returns)
+    return max(0.10, min(2.0, math.sqrt(sum_sq / sum_dt * 365.25 * 24 * 3600)))
+
+
+def _random_walk(n, start_ts):
+    rng = random.Random(7)
+    price, out = 100.0, []
+    for i in range(n):
+        price *= math.exp(rng.gauss(0.0, 0.002))
+        out.append((price, start_ts + 5.0 * i))
+    return out
+
+
+@pytest.mark.parametrize("feed_cls", [BinancePriceFeed, ChainlinkPriceFeed])
+def test_volatility_matches_reference_across_ring_wrap(feed_cls):
+    feed = feed_cls(coins=["BTC"])
+    state = feed._state["BTC"]
+    samples = _random_walk(HISTORY_LEN + 137, start_ts=1_000.0)
+
+    for price, ts in samples[:8]:
+        state.add_sample(price, ts)
+    assert feed._calculate_volatility("BTC") == 0.50
+
+    for price, ts in samples[8:]:
+        state.add_sample(price, ts)
+    assert state.count == HISTORY_LEN
+    assert feed._calculate_volatility("BTC") == pytest.approx(
+        _reference_vol(samples[-HISTORY_LEN:]), rel=1e-9
+    )
+
+
+@pytest.mark.parametrize("feed_cls", [BinancePriceFeed, ChainlinkPriceFeed])
+def test_momentum_uses_last_sample_before_cutoff(feed_cls):
+    feed = feed_cls(coins=["BTC"])
+    state = feed._state["BTC"]
+    now = time.time()
+    for price, age in [(100.0, 60.0), (101.0, 40.0), (102.0, 20.0)]:
+        state.add_sample(price, now - age)
+    state.price = 103.0
+
+    assert feed.get_momentum("BTC", lookback_seconds=30.0) == pytest.approx(2.0 / 101.0)
+    # Nothing old enough -> falls back to the oldest sample
+    assert feed.get_momentum("BTC", lookback_seconds=600.0) == pytest.approx(0.03)
+    assert feed.get_momentum("ETH") == 0.0
+
+
+def test_binance_routes_combined_stream_messages_by_symbol():
+    feed = BinancePriceFeed(coins=["BTC", "ETH"])
+    seen = []
+    feed.on_price(lambda coin, price: seen.append((coin, price)))
+
+    feed._handle_message(
+        '{"stream":"ethusdt@aggTrade","data":{"e":"aggTrade","s":"ETHUSDT",'
+        '"p":"3000.5","q":"1.2","T":1700000000000,"m":true}}'
+    )
+    feed._handle_message(
+        '{"stream":"btcusdt@bookTicker","data":{"s":"BTCUSDT","b":"60000","a":"60002"}}'
+    )
+    feed._handle_message(
+        '{"stream":"solusdt@aggTrade","data":{"e":"aggTrade","s":"SOLUSDT",'
+        '"p":"150","q":"1","T":1700000000000,"m":false}}'
+    )
+
+    assert seen == [("ETH", 3000.5), ("BTC", 60001.0)]
+    assert feed.get_price("ETH") == 3000.5
+    assert feed._state["ETH"].count == 1
+
+
+def test_chainlink_samples_at_most_once_per_interval():
+    feed = ChainlinkPriceFeed(coins=["BTC"], vol_sample_interval=5.0)
+    for i, ts_ms in enumerate([1_700_000_000_000, 1_700_000_002_000, 1_700_000_005_000]):
+        feed._handle_message(
+            '{"topic":"crypto_prices_chainlink","payload":'
+            f'{{"symbol":"btc/usd","value":{60000 + i},"timestamp":{ts_ms}}}}}'
+        )
+
+    state = feed._state["BTC"]
+    assert state.count == 2
+    assert state.price == 60002.0
+    assert state.next_sample_ts == pytest.approx(1_700_000_010.0)
+
+
+def test_volatility_tracks_each_new_sample():
+    feed = ChainlinkPriceFeed(coins=["BTC"])
+    state = feed._state["BTC"]
+    samples = _random_walk(20, start_ts=1_000.0)
+    for price, ts in samples:
+        state.add_sample(price, ts)
+    assert feed.get_volatility("BTC") == pytest.approx(_reference_vol(samples), rel=1e-9)
+
+    samples.append((samples[-1][0] * 1.01, 2_000.0))
+    state.add_sample(*samples[-1])
+    assert feed.get_volatility("BTC") == pytest.approx(_reference_vol(samples), rel=1e-9)
+    assert feed.get_volatility("ETH") == 0.50
+
+
+def test_running_sums_match_reference_with_invalid_pairs():
+    feed = BinancePriceFeed(coins=["BTC"])
+    state = feed._state["BTC"]
+    rng = random.Random(11)
+    samples = []
+    ts = 0.0
+    for n in range(2 * HISTORY_LEN + 50):
+        ts += rng.choice([0.0, 5.0, 5.0, 7.5])  # some zero-dt pairs
+        price = 0.0 if rng.random() < 0.02 else 100.0 * math.exp(rng.gauss(0.0, 0.01))
+        samples.append((price, ts))
+        state.add_sample(price, ts)
+        if n % 97 == 0 or n > 2 * HISTORY_LEN:
+            window = samples[-HISTORY_LEN:]
+            assert feed.get_volatility("BTC") == pytest.approx(_reference_vol(window), rel=1e-9)
+
+
+def test_chainlink_ignores_other_frames():
+    feed = ChainlinkPriceFeed(coins=["BTC"])
+    feed._handle_message('{"topic":"activity","payload":{"symbol":"btc/usd","value":1}}')
+    feed._handle_message("")
+    feed._handle_message("crypto_prices_chainlink{not json")
+    assert feed.get_price("BTC") == 0.0
+
+
+def test_start_returns_as_soon_as_every_coin_is_priced(monkeypatch):
+    feed = ChainlinkPriceFeed(coins=["BTC", "ETH"])
+
+    async def fake_run_loop():
+        for sym in ("btc/usd", "eth/usd"):
+            await asyncio.sleep(0.01)
+            feed._handle_message(
+                '{"topic":"crypto_prices_chainlink","payload":'
+                f'{{"symbol":"{sym}","value":100,"timestamp":1700000000000}}}}'
+            )
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr(feed, "_run_loop", fake_run_loop)
+
+    async def main():
+        t0 = time.monotonic()
+        assert await feed.start() is True
+        elapsed = time.monotonic() - t0
+        await feed.stop()
+        return elapsed
+
+    assert asyncio.run(main()) < 1.0
@@ -0,0 +1,107 @@
+"""
+Unit tests for the runner .env loader.
+"""
+
+import asyncio
+import os
+import signal
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.runtime import load_env_file, run_main
+
+
+def test_load_env_file_parses_and_keeps_existing(tmp_path, monkeypatch):
+    env = tmp_path / ".env"
+    env.write_text(
+        "# comment\n"
+        "\n"
+        "POLY_T_A=plain\n"
+        "export POLY_T_B=\"quoted # not a comment\"\n"
+        "POLY_T_C='single'\n"
+        "POLY_T_D=value # trailing\n"
+        "POLY_T_E=from_file\n"
+        "not a pair\n"
+    )
+    for k in ("POLY_T_A", "POLY_T_B", "POLY_T_C", "POLY_T_D"):
+        monkeypatch.delenv(k, raising=False)
+    monkeypatch.setenv("POLY_T_E", "from_env")
+
+    assert load_env_file(env) == 4
+    assert os.environ["POLY_T_A"] == "plain"
+    assert os.environ["POLY_T_B"] == "quoted # not a comment"
+    assert os.environ["POLY_T_C"] == "single"
+    assert os.environ["POLY_T_D"] == "value"
+    assert os.environ["POLY_T_E"] == "from_env"
+
+    for k in ("POLY_T_A", "POLY_T_B", "POLY_T_C", "POLY_T_D"):
+        monkeypatch.delenv(k)
+
+
+def test_load_env_file_matches_dotenv_quoting_and_references(tmp_path, monkeypatch):
+    pytest.importorskip("dotenv")
+    env = tmp_path / ".env"
+    env.write_text(
+        'POLY_T_Q="abc" # comment\n'
+        'POLY_T_ESC="line1\\nline2\\t\\"q\\""\n'
+        "POLY_T_SQ='it\\'s'\n"
+        "POLY_T_REF=${POLY_T_BASE}-x\n"
+        'POLY_T_DEF="${POLY_T_UNSET:-dflt}/${POLY_T_Q}"\n'
+        'POLY_T_OPEN="never closed\n'
+    )
+    keys = ("POLY_T_Q", "POLY_T_ESC", "POLY_T_SQ", "POLY_T_REF", "POLY_T_DEF", "POLY_T_OPEN", "POLY_T_UNSET")
+    for k in keys:
+        monkeypatch.delenv(k, raising=False)
+    monkeypatch.setenv("POLY_T_BASE", "base")
+
+    assert load_env_file(env) == 5
+    assert os.environ["POLY_T_Q"] == "abc"
+    assert os.environ["POLY_T_ESC"] == 'line1\nline2\t"q"'
+    assert os.environ["POLY_T_SQ"] == "it's"
+    assert os.environ["POLY_T_REF"] == "base-x"
+    assert os.environ["POLY_T_DEF"] == "dflt/abc"
+    assert "POLY_T_OPEN" not in os.environ
+
+    for k in keys[:5]:
+        monkeypatch.delenv(k)
+
+
+def test_simple_env_file_does_not_import_dotenv(tmp_path, monkeypatch):
+    env = tmp_path / ".env"
+    env.write_text('POLY_T_S="abc" # comment\n')
+    monkeypatch.delenv("POLY_T_S", raising=False)
+    monkeypatch.setitem(sys.modules, "dotenv", None)  # import would fail
+
+    assert load_env_file(env) == 1
+    assert os.environ["POLY_T_S"] == "abc"
+    monkeypatch.delenv("POLY_T_S")
+
+
+def test_load_env_file_missing_is_noop(tmp_path):
+    assert load_env_file(tmp_path / "missing.env") == 0
+
+
+def test_run_main_forces_debug_off(monkeypatch):
+    monkeypatch.setenv("PYTHONASYNCIODEBUG", "1")
+
+    async def probe():
+        return asyncio.get_running_loop().get_debug()
+
+    assert run_main(probe()) is False
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="no loop signal handlers on Windows")
+def test_run_main_routes_sigterm_to_shutdown_callback():
+    stopped = asyncio.Event()
+
+    async def main():
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.wait_for(stopped.wait(), timeout=2.0)
+        return "clean"
+
+    assert run_main(main(), on_shutdown=stopped.set) == "clean"
+    assert signal.getsignal(signal.SIGTERM) == signal.SIG_DFL
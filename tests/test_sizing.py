@@ -0,0 +1,38 @@
+"""
+Unit tests for binary-market Kelly sizing helpers.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.sizing import breakeven_and_payout, kelly_bet, kelly_fraction, sizing_preview
+
+
+def test_kelly_fraction_matches_net_odds_form():
+    p, price = 0.50, 0.40
+    b = 1.0 / price - 1.0
+    assert kelly_fraction(p, price) == pytest.approx((p * b - (1 - p)) / b)
+
+
+def test_no_edge_or_bad_price_is_zero():
+    assert kelly_fraction(0.40, 0.40) == 0.0
+    assert kelly_fraction(0.30, 0.40) == 0.0
+    assert kelly_fraction(0.90, 0.0) == 0.0
+    assert kelly_fraction(0.90, 1.0) == 0.0
+
+
+def test_kelly_bet_applies_fraction_and_cap():
+    assert kelly_bet(0.55, 0.40, bankroll=100.0, frac=0.5) == pytest.approx(12.5)
+    assert kelly_bet(0.55, 0.40, bankroll=100.0, frac=0.5, cap_usdc=5.0) == 5.0
+
+
+def test_preview_bundles_banner_numbers():
+    preview = sizing_preview(0.55, 0.40, bankroll=100.0, frac=0.5)
+    assert preview.kelly_f == pytest.approx(0.25)
+    assert preview.bet == pytest.approx(12.5)
+    assert (preview.breakeven_wr, preview.payout_mult) == breakeven_and_payout(0.40)
+    assert preview.payout_mult == pytest.approx(2.5)
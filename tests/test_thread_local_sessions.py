@@ -11,6 +11,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.client import ApiClient
 from src.gamma_client import GammaClient
+from lib.leaderboard_api import PolymarketDataAPI
 
 
 def _session_id(client, out_queue: queue.Queue) -> None:
@@ -41,3 +42,17 @@ def test_gamma_client_thread_local_session():
 
     thread_id = out_queue.get()
     assert main_id != thread_id
+
+
+def test_data_api_uses_pooled_thread_local_session():
+    api = PolymarketDataAPI()
+    adapter = api.session.get_adapter("https://data-api.polymarket.com")
+    assert adapter._pool_maxsize == 20
+    assert adapter.max_retries.total == 2
+    assert api.session is api.session
+
+    out_queue = queue.Queue()
+    worker = threading.Thread(target=_session_id, args=(api, out_queue))
+    worker.start()
+    worker.join()
+    assert out_queue.get() != id(api.session)
@@ -0,0 +1,285 @@
+"""
+Unit tests for TradeLogger buffered CSV writes.
+"""
+
+import csv
+import gc
+import io
+import json
+import sys
+import weakref
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.trade_logger import (
+    TradeLogger,
+    TradeRecord,
+    iter_trade_columns,
+    read_pending,
+    read_trade_columns,
+    read_trade_rows,
+    utc_timestamp,
+)
+
+
+def _log(logger: TradeLogger, slug: str) -> None:
+    logger.log_trade(
+        market_slug=slug,
+        coin="BTC",
+        timeframe="5m",
+        side="up",
+        entry_price=0.40,
+        bet_size_usdc=2.0,
+        num_tokens=5.0,
+    )
+
+
+def _csv_rows(path: Path) -> list:
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def test_rows_buffered_until_threshold(tmp_path):
+    path = tmp_path / "trades.csv"
+    logger = TradeLogger(str(path), buffer_rows=2, flush_interval=3600)
+
+    _log(logger, "m1")
+    logger.log_outcome("m1", side="up", won=True, payout=5.0)
+    assert _csv_rows(path) == []
+
+    _log(logger, "m2")
+    logger.log_outcome("m2", side="up", won=False)
+    rows = _csv_rows(path)
+    assert [r["market_slug"] for r in rows] == ["m1", "m2"]
+    assert [r["outcome"] for r in rows] == ["won", "lost"]
+
+
+def test_buffered_rows_survive_in_sidecar(tmp_path):
+    path = tmp_path / "trades.csv"
+    logger = TradeLogger(str(path), buffer_rows=10, flush_interval=3600)
+
+    _log(logger, "m1")
+    logger.log_outcome("m1", side="up", won=True, payout=5.0)
+
+    assert "m1:up" in read_pending(logger.pending_filepath)
+
+    logger.flush()
+    assert [r["market_slug"] for r in _csv_rows(path)] == ["m1"]
+    assert read_pending(logger.pending_filepath) == {}
+
+
+def test_flush_interval_zero_writes_immediately(tmp_path):
+    path = tmp_path / "trades.csv"
+    logger = TradeLogger(str(path), buffer_rows=32, flush_interval=0.0)
+
+    _log(logger, "m1")
+    logger.log_outcome("m1", side="up", won=True, payout=5.0)
+    assert len(_csv_rows(path)) == 1
+
+
+def test_msgpack_log_roundtrips_to_csv_rows(tmp_path):
+    pytest.importorskip("ormsgpack")
+    path = tmp_path / "trades.csv"
+    logger = TradeLogger(str(path), buffer_rows=1, log_format="msgpack")
+
+    _log(logger, "m1")
+    logger.log_outcome("m1", side="up", won=True, payout=5.0)
+
+    assert not path.exists()
+    rows = list(read_trade_rows(logger.data_filepath))
+    assert rows[0]["market_slug"] == "m1"
+    values = tuple(rows[0][h] for h in TradeLogger.CSV_HEADERS)
+    assert TradeLogger.format_csv_row(values)[TradeLogger.CSV_HEADERS.index("pnl")] == "3.00"
+
+    reloaded = TradeLogger(str(path), log_format="msgpack")
+    assert reloaded.stats.wins == 1
+
+
+def test_csv_lines_match_csv_writer():
+    base = TradeRecord(
+        timestamp="2026-01-01T00:00:00+00:00", market_slug="m1", coin="BTC",
+        timeframe="5m", side="up", entry_price=0.4, bet_size_usdc=2.0, num_tokens=5.0,
+    )
+    odd = TradeRecord(**{**vars(base), "market_slug": 'a,"b"'})
+    rows = [TradeLogger._row_values(base), TradeLogger._row_values(odd)]
+
+    buf = io.StringIO()
+    csv.writer(buf).writerows(TradeLogger.format_csv_row(v) for v in rows)
+    assert TradeLogger.format_csv_lines(rows) == buf.getvalue()
+
+
+def test_pending_journal_appends_and_replays(tmp_path):
+    path = tmp_path / "trades.csv"
+    logger = TradeLogger(str(path), buffer_rows=1)
+    _log(logger, "m1")
+    _log(logger, "m2")
+    logger.log_outcome("m1", side="up", won=True, payout=5.0)
+
+    ops = [json.loads(line)["op"] for line in logger.pending_filepath.read_text().splitlines()]
+    assert ops == ["add", "add", "del"]
+
+    reloaded = TradeLogger(str(path))
+    assert list(reloaded.get_pending_trades()) == ["m2:up"]
+    # Startup compaction leaves one add per live trade
+    assert len(reloaded.pending_filepath.read_text().splitlines()) == 1
+
+
+def test_torn_journal_tail_is_ignored(tmp_path):
+    path = tmp_path / "trades.csv"
+    logger = TradeLogger(str(path))
+    _log(logger, "m1")
+    with open(logger.pending_filepath, "ab") as f:
+        f.write(b'{"op": "add", "key": "m2:up", "rec": {')
+
+    assert list(TradeLogger(str(path)).get_pending_trades()) == ["m1:up"]
+
+
+def test_legacy_json_sidecar_is_migrated(tmp_path):
+    path = tmp_path / "trades.csv"
+    seed = TradeLogger(str(path))
+    _log(seed, "m1")
+    record = seed.get_pending_trades()["m1:up"]
+    seed.close()
+    seed.pending_filepath.unlink()
+
+    legacy = tmp_path / "trades.pending.json"
+    legacy.write_text(json.dumps({"m1:up": record.__dict__}))
+
+    logger = TradeLogger(str(path))
+    assert list(logger.get_pending_trades()) == ["m1:up"]
+    assert not legacy.exists()
+    assert (tmp_path / "trades.pending.json.migrated").exists()
+
+
+def test_reloaded_stats_match_live_stats(tmp_path):
+    path = tmp_path / "trades.csv"
+    logger = TradeLogger(str(path), buffer_rows=1)
+    for i, (price, won) in enumerate([(0.40, True), (0.40, False), (0.215, True)]):
+        logger.log_trade(
+            market_slug=f"m{i}", coin="BTC", timeframe="5m", side="up",
+            entry_price=price, bet_size_usdc=2.0, num_tokens=5.0,
+        )
+        logger.log_outcome(f"m{i}", side="up", won=won, payout=5.0 if won else 0.0)
+
+    live, reloaded = logger.stats, TradeLogger(str(path)).stats
+    assert (reloaded.total_trades, reloaded.wins, reloaded.losses) == (3, 2, 1)
+    assert reloaded.total_pnl == pytest.approx(live.total_pnl)
+    assert reloaded.total_payout == pytest.approx(live.total_payout)
+    assert reloaded.active_buckets() == live.active_buckets() == [(22, 1, 1), (40, 2, 1)]
+
+
+def test_fsync_is_batched(tmp_path, monkeypatch):
+    synced = []
+    monkeypatch.setattr("lib.trade_logger.os.fsync", synced.append)
+    logger = TradeLogger(str(tmp_path / "trades.csv"), buffer_rows=1, fsync_rows=3, fsync_interval=60.0)
+
+    for i in range(3):
+        _log(logger, f"m{i}")
+        logger.log_outcome(f"m{i}", side="up", won=True, payout=5.0)
+        # log + journal are synced together on the third row only
+        assert len(synced) == (2 if i == 2 else 0)
+
+    logger.close()
+    assert len(synced) == 4  # close() syncs both again
+
+
+def test_trade_columns_read_in_chunks(tmp_path):
+    logger = TradeLogger(str(tmp_path / "trades.csv"), buffer_rows=1)
+    for i in range(5):
+        _log(logger, f"m{i}")
+        logger.log_outcome(f"m{i}", side="up", won=i % 2 == 0, payout=5.0)
+
+    chunks = list(iter_trade_columns(logger.data_filepath, ("outcome", "pnl"), chunk_rows=2))
+    assert [len(c["pnl"]) for c in chunks] == [2, 2, 1]
+    assert list(read_trade_columns(logger.data_filepath, ("outcome",))["outcome"]) == [
+        "won", "lost", "won", "lost", "won",
+    ]
+
+
+def test_utc_timestamp_matches_isoformat():
+    before = datetime.now(timezone.utc)
+    stamp = utc_timestamp()
+    after = datetime.now(timezone.utc)
+
+    assert len(stamp) == len("2026-01-01T00:00:00.000000+00:00")
+    assert before <= datetime.fromisoformat(stamp) <= after
+
+
+def test_pending_lookup_by_market(tmp_path):
+    logger = TradeLogger(str(tmp_path / "trades.csv"), buffer_rows=1)
+    _log(logger, "m1")
+    _log(logger, "m2")
+    logger.log_trade(
+        market_slug="m1", coin="BTC", timeframe="5m", side="down",
+        entry_price=0.3, bet_size_usdc=1.5, num_tokens=5.0,
+    )
+    assert sorted(logger.get_pending_slugs()) == ["m1", "m2"]
+    assert sorted(side for side, _ in logger.get_pending_for_market("m1")) == ["down", "up"]
+
+    logger.log_outcome("m1", side="up", won=True, payout=5.0)
+    logger.log_outcome("m2", side="up", won=False)
+    assert logger.get_pending_slugs() == ["m1"]
+    assert [side for side, _ in logger.get_pending_for_market("m1")] == ["down"]
+    assert logger.get_pending_for_market("m2") == []
+
+
+def test_truncated_trailing_row_keeps_earlier_stats(tmp_path):
+    path = tmp_path / "trades.csv"
+    logger = TradeLogger(str(path), buffer_rows=1)
+    _log(logger, "m1")
+    logger.log_outcome("m1", side="up", won=True, payout=5.0)
+    logger.close()
+    with open(path, "a", newline="") as f:
+        f.write("2026-01-01T00:00:00+00:00,m2,BTC,5m,up,0.40")  # torn write
+
+    stats = TradeLogger(str(path)).stats
+    assert (stats.total_trades, stats.wins) == (1, 1)
+    assert stats.total_pnl == pytest.approx(3.0)
+    assert stats.active_buckets() == [(40, 1, 1)]
+
+
+def test_corrupt_row_is_skipped_without_dropping_the_rest(tmp_path):
+    path = tmp_path / "trades.csv"
+    logger = TradeLogger(str(path), buffer_rows=1)
+    _log(logger, "m1")
+    logger.log_outcome("m1", side="up", won=True, payout=5.0)
+    logger.close()
+    with open(path, newline="") as f:
+        good = f.read().splitlines()[1]
+    with open(path, "a", newline="") as f:
+        f.write(good.replace("0.4000", "garbage") + "\r\n")
+        f.write(good.replace("m1", "m2") + "\r\n")
+
+    stats = TradeLogger(str(path)).stats
+    assert (stats.total_trades, stats.wins) == (2, 2)
+    assert stats.total_pnl == pytest.approx(6.0)
+
+
+def test_flush_if_due_writes_rows_after_interval(tmp_path):
+    path = tmp_path / "trades.csv"
+    logger = TradeLogger(str(path), buffer_rows=10, flush_interval=60.0)
+    _log(logger, "m1")
+    logger.log_outcome("m1", side="up", won=True, payout=5.0)
+
+    logger.flush_if_due()
+    assert _csv_rows(path) == []
+
+    logger._buffered_since -= 60.0
+    logger.flush_if_due()
+    assert [r["market_slug"] for r in _csv_rows(path)] == ["m1"]
+
+
+def test_loggers_are_not_kept_alive_by_the_exit_hook(tmp_path):
+    closed = TradeLogger(str(tmp_path / "a.csv"))
+    closed.close()
+    assert not closed._atexit_registered
+    dropped = TradeLogger(str(tmp_path / "b.csv"))  # never closed
+
+    refs = [weakref.ref(closed), weakref.ref(dropped)]
+    del closed, dropped
+    gc.collect()
+    assert [r() for r in refs] == [None, None]
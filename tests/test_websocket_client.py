@@ -0,0 +1,76 @@
+"""
+Unit tests for WebSocket heartbeat guard and reconnect backoff.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.websocket_client import HeartbeatGuard, _backoff_delay
+
+
+class _FakeClient:
+    def __init__(self, reply: bool):
+        self.reply = reply
+        self.is_connected = True
+        self.sent = []
+        self.reconnects = 0
+        self.guard = None
+
+    async def send_raw(self, message: str) -> None:
+        self.sent.append(message)
+        if self.reply:
+            self.guard.on_pong()
+
+    async def force_reconnect(self) -> None:
+        self.reconnects += 1
+        self.is_connected = False
+
+
+def _run_guard(reply: bool, rounds: float) -> _FakeClient:
+    client = _FakeClient(reply)
+    client.guard = HeartbeatGuard(client, interval=0.01, timeout=0.02)
+
+    async def go():
+        task = client.guard.start()
+        await asyncio.sleep(rounds)
+        client.is_connected = False
+        await HeartbeatGuard.stop(task)
+
+    asyncio.run(go())
+    return client
+
+
+def test_missing_pong_forces_reconnect():
+    client = _run_guard(reply=False, rounds=0.2)
+    assert client.sent[0] == "PING"
+    assert client.reconnects == 1
+    assert client.guard.missed == 1
+
+
+def test_pong_records_rtt_without_reconnect():
+    client = _run_guard(reply=True, rounds=0.1)
+    assert len(client.sent) >= 2
+    assert client.reconnects == 0
+    assert client.guard.rtt_ema is not None
+    assert client.guard.rtt_baseline <= client.guard.rtt_ema
+
+
+def test_rtt_degradation_warns_on_transition(caplog):
+    guard = HeartbeatGuard(client=None)
+    guard._record_rtt(0.010)
+    for _ in range(10):
+        guard._record_rtt(0.100)
+    warnings = [r for r in caplog.records if "RTT degraded" in r.message]
+    assert len(warnings) == 1
+
+
+def test_zero_interval_disables_guard():
+    guard = HeartbeatGuard(client=None, interval=0)
+    assert guard.start() is None
+
+
+def test_backoff_is_exponential_and_capped():
+    assert [_backoff_delay(n, 5.0) for n in range(6)] == [0.5, 1.0, 2.0, 4.0, 5.0, 5.0]